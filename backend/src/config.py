@@ -51,6 +51,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./data/sweedle.db"
+    DB_POOL_SIZE: int = 20  # Persistent connections kept in the pool
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed during bursts
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a connection before failing fast
+    DB_POOL_PRE_PING: bool = True  # Validate connections before handing them out
 
     # Storage paths (relative to backend directory)
     STORAGE_ROOT: Path = Path("./storage")
@@ -5,7 +5,8 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,9 @@ class JobQueue:
         self._completed_count = 0
         self._failed_count = 0
 
+        # get_status() snapshot; reset whenever queue state changes
+        self._cached_status: Optional[Mapping[str, Any]] = None
+
     @property
     def size(self) -> int:
         """Current queue size."""
@@ -127,6 +131,7 @@ class JobQueue:
             self._jobs[job_id] = job
 
         await self._queue.put(job)
+        self._cached_status = None
         logger.info(f"Enqueued job {job_id} with priority {priority.name}")
 
         return job
@@ -141,6 +146,7 @@ class JobQueue:
         """
         try:
             job = await self._queue.get()
+            self._cached_status = None
 
             async with self._lock:
                 # Check if job was cancelled while waiting
@@ -151,6 +157,7 @@ class JobQueue:
                 job.status = JobStatus.PROCESSING
                 job.started_at = datetime.utcnow()
                 self._current_job = job
+                self._cached_status = None
 
             logger.info(f"Dequeued job {job.id}")
             return job
@@ -192,6 +199,8 @@ class JobQueue:
             if self._current_job and self._current_job.id == job_id:
                 self._current_job = None
 
+            self._cached_status = None
+
         self._queue.task_done()
         logger.info(f"Completed job {job_id} with status {job.status.value}")
 
@@ -237,6 +246,7 @@ class JobQueue:
             job.status = JobStatus.CANCELLED
             job.completed_at = datetime.utcnow()
             job.error = "Cancelled by user"
+            self._cached_status = None
 
         logger.info(f"Cancelled job {job_id}")
         return True
@@ -252,24 +262,30 @@ class JobQueue:
         """
         return self._jobs.get(job_id)
 
-    def get_status(self) -> dict:
+    def get_status(self) -> Mapping[str, Any]:
         """Get queue status summary.
 
+        The summary is computed once per queue state change and shared
+        between callers, so it is returned read-only.
+
         Returns:
-            Dictionary with queue statistics
+            Read-only mapping with queue statistics
         """
-        pending = sum(1 for j in self._jobs.values() if j.status == JobStatus.PENDING)
-        processing = 1 if self._current_job else 0
-
-        return {
-            "queue_size": self._queue.qsize(),
-            "current_job_id": self._current_job.id if self._current_job else None,
-            "pending_count": pending,
-            "processing_count": processing,
-            "completed_count": self._completed_count,
-            "failed_count": self._failed_count,
-            "total_jobs": len(self._jobs),
-        }
+        if self._cached_status is None:
+            pending = sum(1 for j in self._jobs.values() if j.status == JobStatus.PENDING)
+            processing = 1 if self._current_job else 0
+
+            self._cached_status = MappingProxyType({
+                "queue_size": self._queue.qsize(),
+                "current_job_id": self._current_job.id if self._current_job else None,
+                "pending_count": pending,
+                "processing_count": processing,
+                "completed_count": self._completed_count,
+                "failed_count": self._failed_count,
+                "total_jobs": len(self._jobs),
+            })
+
+        return self._cached_status
 
     def get_pending_jobs(self) -> list[Job]:
         """Get all pending jobs in priority order.
@@ -321,6 +337,9 @@ class JobQueue:
                 del self._jobs[job_id]
                 removed += 1
 
+            if removed:
+                self._cached_status = None
+
         if removed:
             logger.info(f"Cleared {removed} old jobs from queue")
 
@@ -1,16 +1,21 @@
 """WebSocket connection manager for real-time updates."""
 
 import asyncio
-import json
 import logging
-from datetime import datetime
-from typing import Any, Optional, Set
+from datetime import datetime, timezone
+from typing import Any, Coroutine, Iterable, Mapping, Optional, Set
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 class WebSocketManager:
     """Manages WebSocket connections and message broadcasting.
 
@@ -86,23 +91,29 @@ class WebSocketManager:
                 if not self._subscriptions[job_id]:
                     del self._subscriptions[job_id]
 
-    async def broadcast(self, message: dict) -> None:
-        """Broadcast message to all connected clients.
+    @staticmethod
+    def encode(message: dict) -> str:
+        """Encode a message once for sending to any number of clients.
+
+        Adds a timestamp if the message has none.
 
         Args:
-            message: Message dictionary to send
-        """
-        if not self._connections:
-            return
+            message: Message dictionary
 
-        # Add timestamp if not present
+        Returns:
+            JSON text frame payload
+        """
         if "timestamp" not in message:
-            message["timestamp"] = datetime.utcnow().isoformat()
+            message["timestamp"] = _now_iso()
+
+        # Sent as text: clients JSON.parse() event.data, which must be a string
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
 
-        data = json.dumps(message)
+    async def _fan_out(self, connections: Iterable[WebSocket], data: str) -> None:
+        """Send a pre-encoded payload to each connection, dropping dead ones."""
         disconnected = []
 
-        for connection in self._connections.copy():
+        for connection in connections:
             try:
                 await connection.send_text(data)
             except Exception as e:
@@ -113,6 +124,28 @@ class WebSocketManager:
         for conn in disconnected:
             await self.disconnect(conn)
 
+    async def broadcast(self, message: dict) -> None:
+        """Broadcast message to all connected clients.
+
+        Args:
+            message: Message dictionary to send
+        """
+        if not self._connections:
+            return
+
+        await self.broadcast_raw(self.encode(message))
+
+    async def broadcast_raw(self, payload: str) -> None:
+        """Broadcast an already-encoded payload to all connected clients.
+
+        Args:
+            payload: JSON text, e.g. from ``encode()``
+        """
+        if not self._connections:
+            return
+
+        await self._fan_out(self._connections.copy(), payload)
+
     async def send_to_job(self, job_id: str, message: dict) -> None:
         """Send message to subscribers of a specific job.
 
@@ -128,21 +161,7 @@ class WebSocketManager:
             await self.broadcast(message)
             return
 
-        if "timestamp" not in message:
-            message["timestamp"] = datetime.utcnow().isoformat()
-
-        data = json.dumps(message)
-        disconnected = []
-
-        for connection in subscribers:
-            try:
-                await connection.send_text(data)
-            except Exception as e:
-                logger.debug(f"Failed to send to subscriber: {e}")
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            await self.disconnect(conn)
+        await self._fan_out(subscribers, self.encode(message))
 
     async def send_progress(
         self,
@@ -184,17 +203,14 @@ class WebSocketManager:
 
         await self.broadcast(message)
 
-    async def send_queue_status(self, status: dict) -> None:
+    async def send_queue_status(self, status: Mapping[str, Any]) -> None:
         """Send queue status update.
 
         Args:
             status: Queue status dictionary
         """
-        message = {
-            "type": "queue_status",
-            **status,
-        }
-        await self.broadcast(message)
+        if self._connections:
+            await self.broadcast_raw(queue_status_payload(status))
 
     async def send_job_created(
         self,
@@ -359,15 +375,10 @@ class WebSocketManager:
             progress: Progress within stage (0.0-1.0)
             message_text: Status message
         """
-        message = {
-            "type": "workflow_update",
-            "asset_id": asset_id,
-            "stage": stage,
-            "status": status,
-            "progress": progress,
-            "message": message_text,
-        }
-        await self.broadcast(message)
+        if self._connections:
+            await self.broadcast_raw(workflow_update_payload(
+                asset_id, stage, status, progress, message_text
+            ))
 
     async def send_pipeline_status(
         self,
@@ -394,9 +405,120 @@ class WebSocketManager:
         await self.broadcast(message)
 
 
+# Trusted server -> client payloads, encoded without model validation.
+# The Pydantic models in src.websocket.schemas document the same shapes.
+
+def progress_payload(job_id: str, progress: float, stage: str, status: str) -> str:
+    """Encode a job progress message.
+
+    Args:
+        job_id: Job ID
+        progress: Progress value (0.0-1.0)
+        stage: Current stage description
+        status: Job status
+
+    Returns:
+        JSON text frame payload
+    """
+    return orjson.dumps({
+        "type": "progress",
+        "job_id": job_id,
+        "progress": progress,
+        "stage": stage,
+        "status": status,
+        "timestamp": _now_iso(),
+    }).decode()
+
+
+def queue_status_payload(status: Mapping[str, Any]) -> str:
+    """Encode a queue status message.
+
+    Args:
+        status: Queue status, as returned by ``JobQueue.get_status()``
+
+    Returns:
+        JSON text frame payload
+    """
+    return orjson.dumps({
+        "type": "queue_status",
+        **status,
+        "timestamp": _now_iso(),
+    }).decode()
+
+
+def workflow_update_payload(
+    asset_id: str,
+    stage: str,
+    status: str,
+    progress: float,
+    message_text: str,
+) -> str:
+    """Encode a workflow stage update.
+
+    Args:
+        asset_id: Asset ID
+        stage: Workflow stage value (a plain string, not a ``WorkflowStage``)
+        status: Stage status
+        progress: Progress within stage (0.0-1.0)
+        message_text: Status message
+
+    Returns:
+        JSON text frame payload
+    """
+    return orjson.dumps({
+        "type": "workflow_update",
+        "asset_id": asset_id,
+        "stage": stage,
+        "status": status,
+        "progress": progress,
+        "message": message_text,
+        "timestamp": _now_iso(),
+    }).decode()
+
+
+def error_payload(code: str, message_text: str) -> str:
+    """Encode an error message.
+
+    Args:
+        code: Error code
+        message_text: Error message
+
+    Returns:
+        JSON text frame payload
+    """
+    return orjson.dumps({
+        "type": "error",
+        "code": code,
+        "message": message_text,
+        "timestamp": _now_iso(),
+    }).decode()
+
+
 # Global manager instance
 _manager: Optional[WebSocketManager] = None
 
+# Strong references to in-flight background sends so they aren't
+# garbage-collected before they finish
+_background_sends: Set[asyncio.Task] = set()
+
+
+def send_in_background(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Schedule a broadcast without waiting for it to finish.
+
+    Use this where the caller doesn't need delivery to complete (e.g. an
+    HTTP handler notifying clients) so a slow subscriber can't stall it.
+
+    Args:
+        coro: Send coroutine, e.g. ``manager.send_job_created(...)``
+
+    Returns:
+        The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_sends.add(task)
+    task.add_done_callback(_background_sends.discard)
+    return task
+
 
 def get_websocket_manager() -> WebSocketManager:
     """Get or create the global WebSocket manager instance."""
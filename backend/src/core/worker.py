@@ -879,7 +879,7 @@ class BackgroundWorker:
         Returns:
             Result dictionary
         """
-        from src.rigging.service import get_rigging_service
+        from src.rigging.service import get_rigging_service, skeleton_blob
         from src.rigging.schemas import CharacterType, RiggingProcessor
         # async_session_maker already imported at module level
 
@@ -950,6 +950,7 @@ class BackgroundWorker:
                 if asset:
                     asset.is_rigged = True
                     asset.rigging_data = result.skeleton.model_dump() if result.skeleton else None
+                    asset.rigging_blob = skeleton_blob(result.skeleton)
                     asset.character_type = result.detected_type.value if result.detected_type else None
                     asset.rigged_mesh_path = result.rigged_mesh_path
                     asset.rigging_processor = result.processor_used.value if result.processor_used else None
@@ -1,9 +1,12 @@
 """Database setup and session management."""
 
+import asyncio
 from typing import AsyncGenerator
 
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateColumn
 
 from src.config import settings
 
@@ -13,11 +16,30 @@ class Base(DeclarativeBase):
     pass
 
 
+def _pool_options(database_url: str) -> dict:
+    """Get connection pool options for the async engine.
+
+    In-memory SQLite uses a single static connection, so QueuePool sizing
+    does not apply there. Every other URL gets a sized QueuePool that fails
+    fast instead of queueing requests behind a 30 second default timeout.
+    """
+    if database_url.startswith("sqlite") and ":memory:" in database_url:
+        return {}
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    **_pool_options(settings.DATABASE_URL),
 )
 
 # Session factory
@@ -35,6 +57,53 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips existing tables, so columns and indexes added to
+        # a model later would never reach an existing database
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _add_missing_columns(sync_conn) -> None:
+    """Add model-declared nullable columns missing from existing tables."""
+    inspector = inspect(sync_conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            ddl = CreateColumn(column).compile(dialect=sync_conn.dialect)
+            sync_conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Create any model-declared indexes missing from existing tables."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
+async def warm_pool() -> int:
+    """Open the pool's persistent connections up front.
+
+    Checks out ``DB_POOL_SIZE`` connections concurrently and runs ``SELECT 1``
+    on each before returning them, so the first requests after startup don't
+    pay the connection handshake. SQLite has no handshake to save - opening
+    a file-backed connection is just a file open - so it is skipped there.
+
+    Returns:
+        Number of connections warmed
+    """
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return 0
+
+    pool_size = _pool_options(settings.DATABASE_URL)["pool_size"]
+
+    async def _prime() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*[_prime() for _ in range(pool_size)])
+    return pool_size
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -11,8 +11,10 @@ from sqlalchemy import (
     Enum as SQLEnum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     JSON,
+    LargeBinary,
     String,
     Table,
     Text,
@@ -135,12 +137,23 @@ class Asset(Base):
     # Rigging information
     is_rigged = Column(Boolean, default=False)
     rigging_data = Column(JSON, nullable=True)  # SkeletonData JSON
+    rigging_blob = Column(LargeBinary, nullable=True)  # SkeletonData.to_bytes(), when encodable
     character_type = Column(String(50), nullable=True)  # humanoid, quadruped
     rigged_mesh_path = Column(String(500), nullable=True)
     rigging_processor = Column(String(50), nullable=True)  # unirig, blender
 
     # Workflow tracking
-    workflow_stage = Column(String(50), default=WorkflowStage.UPLOADED.value)
+    # Stored as the stage's string value, so existing rows stay readable;
+    # loads as WorkflowStage
+    workflow_stage = Column(
+        SQLEnum(
+            WorkflowStage,
+            native_enum=False,
+            length=32,
+            values_callable=lambda stages: [stage.value for stage in stages],
+        ),
+        default=WorkflowStage.UPLOADED,
+    )
     mesh_path = Column(String(500), nullable=True)      # Untextured mesh path
     textured_path = Column(String(500), nullable=True)  # Textured mesh path
 
@@ -199,3 +212,15 @@ class GenerationJob(Base):
 
     # Relationships
     asset = relationship("Asset", back_populates="job")
+
+
+# Composite index for the "active job for this asset" lookup done on every
+# rig submission. Status is a key column rather than a partial-index filter:
+# the lookup binds its statuses as parameters, which a partial index's
+# literal WHERE clause can never be matched against.
+Index(
+    "ix_gen_jobs_asset_type_status",
+    GenerationJob.asset_id,
+    GenerationJob.job_type,
+    GenerationJob.status,
+)
@@ -25,7 +25,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, HTMLResponse
 
 from src.config import settings, apply_gpu_optimizations
-from src.database import init_db
+from src.database import init_db, warm_pool
 
 # Frontend build directory
 FRONTEND_DIR = Path(__file__).parent.parent.parent / "frontend" / "dist"
@@ -66,6 +66,11 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized")
 
+    # Prime the connection pool so early requests skip the handshake
+    warmed = await warm_pool()
+    if warmed:
+        logger.info(f"Database pool warmed ({warmed} connections)")
+
     # Initialize core components
     from src.core.queue import get_queue
     from src.core.websocket_manager import get_websocket_manager
@@ -276,10 +281,14 @@ async def device_stats():
 
 # VRAM diagnostic endpoint
 @app.get("/api/device/vram-diagnostic")
-async def vram_diagnostic():
-    """Run full VRAM diagnostic to identify memory usage and leaks."""
+async def vram_diagnostic(verbose: bool = False):
+    """
+    Run full VRAM diagnostic to identify memory usage and leaks.
+
+    Pass ``verbose=true`` to list individual CUDA tensors (slow).
+    """
     from src.utils.vram_diagnostic import full_diagnostic
-    return full_diagnostic()
+    return full_diagnostic(verbose=verbose)
 
 
 # Clear VRAM endpoint
@@ -5,18 +5,20 @@ Provides endpoints for auto-rigging, skeleton management, and rigging job contro
 """
 
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Form, status
+from fastapi import APIRouter, Depends, HTTPException, Form, Header, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, Text, exists, select, type_coerce
 
 from ..config import settings
 from ..database import get_session
 from ..core.queue import get_queue, JobPriority as QueuePriority
-from ..core.websocket_manager import get_websocket_manager
+from ..core.websocket_manager import get_websocket_manager, send_in_background
 from ..generation.models import Asset, GenerationJob, AssetStatus, JobStatus
 
 from .schemas import (
@@ -32,10 +34,38 @@ from .schemas import (
     TemplateListResponse,
     SkeletonTemplateInfo,
 )
-from .service import get_rigging_service
+from .service import (
+    get_rigging_service,
+    has_rigging_data,
+    parse_skeleton,
+    rigging_data_digest,
+)
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/rigging", tags=["rigging"])
+router = APIRouter(
+    prefix="/rigging",
+    tags=["rigging"],
+    default_response_class=ORJSONResponse,
+)
+
+# Encoded skeleton responses keyed by asset ID, rigging_data digest and the
+# other response fields, so a re-rig is never served stale bytes
+SKELETON_RESPONSE_CACHE_SIZE = 256
+_skeleton_response_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+
+def _active_rig_job_query(asset_id: str) -> Select:
+    """Build the EXISTS query for a pending or processing rig job on an asset.
+
+    Served by the ``ix_gen_jobs_asset_type_status`` index.
+    """
+    return select(
+        exists().where(
+            GenerationJob.asset_id == asset_id,
+            GenerationJob.job_type == "rig_asset",
+            GenerationJob.status.in_([JobStatus.PENDING, JobStatus.PROCESSING]),
+        )
+    )
 
 
 @router.post("/auto-rig", response_model=AutoRigResponse)
@@ -80,14 +110,8 @@ async def auto_rig_asset(
         )
 
     # Check if there's an existing rigging job for this asset
-    existing_job = await db.execute(
-        select(GenerationJob).where(
-            GenerationJob.asset_id == asset_id,
-            GenerationJob.job_type == "rig_asset",
-            GenerationJob.status.in_([JobStatus.PENDING, JobStatus.PROCESSING]),
-        )
-    )
-    if existing_job.scalar_one_or_none():
+    has_active_job = await db.scalar(_active_rig_job_query(asset_id))
+    if has_active_job:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="A rigging job is already in progress for this asset",
@@ -129,14 +153,14 @@ async def auto_rig_asset(
         priority=queue_priority,
     )
 
-    # Broadcast job created
+    # Broadcast job created without holding up the response
     ws_manager = get_websocket_manager()
-    await ws_manager.send_job_created(
+    send_in_background(ws_manager.send_job_created(
         job_id=job_id,
         asset_id=asset_id,
         job_type="rig_asset",
         position=0,
-    )
+    ))
 
     logger.info(f"Created rigging job {job_id} for asset {asset_id}")
 
@@ -248,44 +272,78 @@ async def cancel_rigging_job(
     return {"message": "Job cancelled", "job_id": job_id}
 
 
-@router.get("/skeleton/{asset_id}", response_model=SkeletonResponse)
+@router.get(
+    "/skeleton/{asset_id}",
+    responses={status.HTTP_200_OK: {"model": SkeletonResponse}},
+)
 async def get_skeleton(
     asset_id: str,
     db: AsyncSession = Depends(get_session),
 ):
-    """Get skeleton data for a rigged asset."""
-    result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    asset = result.scalar_one_or_none()
+    """Get skeleton data for a rigged asset.
 
-    if asset is None:
+    The stored skeleton is parsed through the shared ``parse_skeleton``
+    cache, and the encoded response is cached per skeleton version, so
+    repeat requests skip both validation and serialization.
+    """
+    result = await db.execute(
+        select(
+            Asset.is_rigged,
+            type_coerce(Asset.rigging_data, Text).label("rigging_json"),
+            Asset.rigging_blob,
+            Asset.rigged_mesh_path,
+            Asset.file_path,
+            Asset.rigging_processor,
+            Asset.updated_at,
+        ).where(Asset.id == asset_id)
+    )
+    row = result.one_or_none()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Asset not found: {asset_id}",
         )
 
-    if not asset.is_rigged:
+    if not row.is_rigged:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Asset is not rigged",
         )
 
-    if not asset.rigging_data:
+    if not has_rigging_data(row.rigging_json, row.rigging_blob):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No skeleton data available",
         )
 
-    from .schemas import SkeletonData
+    # The digest changes with every rewrite of the stored skeleton; the
+    # other response fields can change on a re-rig that yields the same one
+    key = (
+        asset_id,
+        rigging_data_digest(row.rigging_blob or row.rigging_json),
+        row.rigged_mesh_path,
+        row.file_path,
+        row.rigging_processor,
+        row.updated_at,
+    )
+    content = _skeleton_response_cache.get(key)
 
-    skeleton = SkeletonData(**asset.rigging_data)
+    if content is None:
+        content = SkeletonResponse(
+            asset_id=asset_id,
+            skeleton=parse_skeleton(asset_id, row.rigging_json, row.rigging_blob),
+            rigged_mesh_path=row.rigged_mesh_path or row.file_path,
+            processor_used=RiggingProcessor(row.rigging_processor) if row.rigging_processor else RiggingProcessor.AUTO,
+            created_at=row.updated_at,
+        ).model_dump_json().encode()
+        _skeleton_response_cache[key] = content
+        if len(_skeleton_response_cache) > SKELETON_RESPONSE_CACHE_SIZE:
+            _skeleton_response_cache.popitem(last=False)
+    else:
+        _skeleton_response_cache.move_to_end(key)
 
-    return SkeletonResponse(
-        asset_id=asset_id,
-        skeleton=skeleton,
-        rigged_mesh_path=asset.rigged_mesh_path or asset.file_path,
-        processor_used=RiggingProcessor(asset.rigging_processor) if asset.rigging_processor else RiggingProcessor.AUTO,
-        created_at=asset.updated_at,
-    )
+    return Response(content=content, media_type="application/json")
 
 
 @router.post("/detect-type", response_model=DetectTypeResponse)
@@ -321,22 +379,43 @@ async def detect_character_type(
         )
 
     service = get_rigging_service(db)
-    detected_type, confidence = await service.detect_character_type(mesh_path)
+    detection = await service.detect_character_type(mesh_path)
 
     return DetectTypeResponse(
         asset_id=request.asset_id,
-        detected_type=detected_type,
-        confidence=confidence,
+        detected_type=detection.character_type,
+        confidence=detection.confidence,
     )
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses weak comparison (RFC 9110): the header may list several tags, any
+    of them may carry a ``W/`` prefix, and ``*`` matches everything.
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @router.get("/templates", response_model=TemplateListResponse)
-async def list_templates():
-    """List available skeleton templates."""
+def list_templates(if_none_match: Optional[str] = Header(None)):
+    """List available skeleton templates.
+
+    Templates are static, so the body is serialized once and served with
+    an ETag; a matching If-None-Match gets a 304.
+    """
     service = get_rigging_service()
-    templates = service.get_templates()
+    content, etag = service.get_templates_response()
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    return TemplateListResponse(templates=templates)
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.post("/reset/{asset_id}")
@@ -361,6 +440,7 @@ async def reset_rigging(
     # Clear rigging state
     asset.is_rigged = False
     asset.rigging_data = None
+    asset.rigging_blob = None
     asset.character_type = None
     asset.rigged_mesh_path = None
     asset.rigging_processor = None
@@ -4,9 +4,12 @@ Pydantic schemas for rigging operations.
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from .skeleton.types import SkeletonArrays
+
 
 class CharacterType(str, Enum):
     """Supported character types for rigging."""
@@ -87,6 +90,25 @@ class SkeletonData(BaseModel):
             bone_count=len(bones),
         )
 
+    def to_arrays(self) -> "SkeletonArrays":
+        """Convert to a struct-of-arrays layout for vectorized bone math."""
+        from .skeleton.types import SkeletonArrays
+
+        return SkeletonArrays.from_skeleton_data(self)
+
+    def to_bytes(self) -> bytes:
+        """Encode to the compact binary skeleton format."""
+        from .skeleton.types import encode_skeleton
+
+        return encode_skeleton(self)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "SkeletonData":
+        """Decode from the compact binary skeleton format."""
+        from .skeleton.types import decode_skeleton
+
+        return decode_skeleton(blob)
+
 
 class WeightData(BaseModel):
     """Vertex weight assignment."""
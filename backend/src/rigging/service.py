@@ -3,12 +3,15 @@ Rigging service - business logic for rigging operations.
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Any, Optional, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+import orjson
 
 from .config import rigging_settings
 from .schemas import (
@@ -18,16 +21,229 @@ from .schemas import (
     SkeletonData,
     CharacterAnalysis,
     SkeletonTemplateInfo,
+    TemplateListResponse,
 )
-from .processors import UniRigProcessor, BlenderProcessor
+from .processors import BaseRiggingProcessor, UniRigProcessor, BlenderProcessor
 from .skeleton import (
     HUMANOID_TEMPLATE,
     QUADRUPED_TEMPLATE,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _lazy_sa():
+    """
+    Import SQLAlchemy and the Asset model on first database access.
+
+    Keeps ``import src.rigging.service`` light for callers that only need
+    skeleton building (CLI tools, Blender subprocesses).
+
+    Returns:
+        Tuple of (select, Asset, raw rigging_data column as JSON text)
+    """
+    from sqlalchemy import Text, select, type_coerce
+    from ..generation.models import Asset
+
+    return select, Asset, type_coerce(Asset.rigging_data, Text).label("rigging_json")
+
+
+# JSON texts of stored rigging_data that mean "no skeleton". A cleared JSON
+# column holds the literal "null" rather than SQL NULL, and empty containers
+# were always treated as not rigged.
+_EMPTY_RIGGING_JSON = frozenset({"", "null", "{}", "[]", '""'})
+
+
+def has_rigging_data(rigging_json: Optional[str], rigging_blob: Optional[bytes] = None) -> bool:
+    """
+    Check whether stored rigging data holds a skeleton.
+
+    Args:
+        rigging_json: rigging_data column read as JSON text
+        rigging_blob: rigging_blob column
+
+    Returns:
+        True if there is a blob; otherwise False for SQL NULL, JSON null
+        and empty values
+    """
+    if rigging_blob:
+        return True
+    return rigging_json is not None and rigging_json.strip() not in _EMPTY_RIGGING_JSON
+
+
+def skeleton_blob(skeleton: Optional[SkeletonData]) -> Optional[bytes]:
+    """
+    Encode a skeleton for the rigging_blob column.
+
+    Args:
+        skeleton: Skeleton being stored as rigging_data
+
+    Returns:
+        Binary encoding, or None when there is no skeleton or it has a bind
+        pose (which only the JSON column can hold)
+    """
+    if skeleton is None or skeleton.bind_pose:
+        return None
+    return skeleton.to_bytes()
+
+
+# Parsed skeletons keyed by (asset_id, digest of the stored JSON). The digest
+# changes with every rewrite of rigging_data, so a re-rig can never be served
+# a stale entry the way a one-second-resolution updated_at could; superseded
+# entries just age out of the LRU.
+SKELETON_CACHE_SIZE = 512
+_skeleton_cache: "OrderedDict[tuple[str, bytes], SkeletonData]" = OrderedDict()
+
+
+def rigging_data_digest(rigging_data: Any) -> bytes:
+    """
+    Digest stored rigging data for use as a cache version.
+
+    Args:
+        rigging_data: Stored skeleton payload (JSON text, a dict, or the
+            binary blob)
+
+    Returns:
+        16-byte BLAKE2b digest of the stored bytes
+    """
+    if isinstance(rigging_data, str):
+        rigging_data = rigging_data.encode()
+    elif not isinstance(rigging_data, bytes):
+        rigging_data = orjson.dumps(rigging_data)
+    return hashlib.blake2b(rigging_data, digest_size=16).digest()
+
+
+def parse_skeleton(
+    asset_id: str,
+    rigging_data: Any,
+    rigging_blob: Optional[bytes] = None,
+) -> SkeletonData:
+    """
+    Parse stored rigging data into SkeletonData, reusing cached results.
+
+    The binary blob is decoded when present; rigging_data is the fallback
+    for rows written before the blob column existed or with a bind pose.
+
+    Args:
+        asset_id: Asset ID the skeleton belongs to
+        rigging_data: Stored skeleton payload (JSON text, or a dict)
+        rigging_blob: Stored ``SkeletonData.to_bytes()`` encoding
+
+    Returns:
+        Parsed SkeletonData (shared instance - do not mutate)
+    """
+    key = (asset_id, rigging_data_digest(rigging_blob or rigging_data))
+
+    skeleton = _skeleton_cache.get(key)
+    if skeleton is not None:
+        _skeleton_cache.move_to_end(key)
+        return skeleton
+
+    # Stored data was validated on write, but model_construct would leave
+    # nested bones as plain dicts; the JSON path validates in pydantic-core
+    # without building intermediate Python objects.
+    if rigging_blob:
+        skeleton = SkeletonData.from_bytes(rigging_blob)
+    elif isinstance(rigging_data, (str, bytes)):
+        skeleton = SkeletonData.model_validate_json(rigging_data)
+    else:
+        skeleton = SkeletonData.model_validate(rigging_data)
+
+    _skeleton_cache[key] = skeleton
+    if len(_skeleton_cache) > SKELETON_CACHE_SIZE:
+        _skeleton_cache.popitem(last=False)
+
+    return skeleton
+
+
+# Template metadata is static, so build it once (inputs are known-valid,
+# which lets us skip validation with model_construct)
+_TEMPLATE_INFOS: tuple[SkeletonTemplateInfo, ...] = (
+    SkeletonTemplateInfo.model_construct(
+        name=HUMANOID_TEMPLATE["name"],
+        character_type=CharacterType.HUMANOID,
+        bone_count=HUMANOID_TEMPLATE["bone_count"],
+        description=HUMANOID_TEMPLATE["description"],
+        preview_url=None,
+    ),
+    SkeletonTemplateInfo.model_construct(
+        name=QUADRUPED_TEMPLATE["name"],
+        character_type=CharacterType.QUADRUPED,
+        bone_count=QUADRUPED_TEMPLATE["bone_count"],
+        description=QUADRUPED_TEMPLATE["description"],
+        preview_url=None,
+    ),
+)
+
+# Serialized once, with a strong ETag so clients can revalidate with a 304
+_TEMPLATE_LIST_JSON: bytes = TemplateListResponse.model_construct(
+    templates=list(_TEMPLATE_INFOS),
+).model_dump_json().encode()
+_TEMPLATE_LIST_ETAG = f'"{hashlib.sha1(_TEMPLATE_LIST_JSON).hexdigest()}"'
+
+
+@dataclass(slots=True, frozen=True)
+class CharacterDetection:
+    """Result of character type detection."""
+    character_type: CharacterType
+    confidence: float
+
+
+# Returned whenever detection fails, so the failure path allocates nothing
+_FALLBACK_DETECTION = CharacterDetection(CharacterType.HUMANOID, 0.5)
+
+
+def _choose_processor(
+    character_type: CharacterType,
+    requested: RiggingProcessor,
+    unirig_enabled: bool,
+    blender_enabled: bool,
+) -> str:
+    """
+    Pick a processor name for a rigging job.
+
+    Returns:
+        "unirig" or "blender"
+    """
+    if requested == RiggingProcessor.UNIRIG:
+        return "unirig"
+    if requested == RiggingProcessor.BLENDER:
+        return "blender"
+
+    # Auto-select based on character type and availability
+    if character_type == CharacterType.QUADRUPED:
+        # Blender is better for quadrupeds
+        return "blender" if blender_enabled else "unirig"
+
+    # UniRig is faster for humanoids
+    return "unirig" if unirig_enabled else "blender"
+
+
+class ProcessorPool:
+    """
+    Rigging processors plus their one-time initialization state.
+
+    One pool is shared by every RiggingService in the process, so
+    processors are constructed and initialized once.
+    """
+
+    def __init__(self):
+        self.unirig = UniRigProcessor()
+        self.blender = BlenderProcessor()
+        self.init_lock = asyncio.Lock()
+        self.init_done = asyncio.Event()
+
+
+@functools.cache
+def get_processor_pool() -> ProcessorPool:
+    """Get the process-wide processor pool."""
+    return ProcessorPool()
+
+
 class RiggingService:
     """
     Service for rigging operations.
@@ -35,31 +251,63 @@ class RiggingService:
     Handles processor selection, character detection, and rigging workflow.
     """
 
-    def __init__(self, db: Optional[AsyncSession] = None):
+    def __init__(
+        self,
+        db: Optional["AsyncSession"] = None,
+        processors: Optional[ProcessorPool] = None,
+    ):
         self.db = db
-        self._unirig = UniRigProcessor()
-        self._blender = BlenderProcessor()
-        self._initialized = False
+        self._processors = processors or get_processor_pool()
+        self._unirig = self._processors.unirig
+        self._blender = self._processors.blender
+        self._dispatch = self._build_dispatch()
 
     async def initialize(self) -> None:
-        """Initialize processors."""
-        if self._initialized:
+        """Initialize processors.
+
+        Runs once per processor pool. Safe to call concurrently: the first
+        caller initializes, the rest wait for it to finish.
+        """
+        pool = self._processors
+        if pool.init_done.is_set():
             return
 
-        # Initialize processors (they handle their own errors)
-        try:
-            if rigging_settings.UNIRIG_ENABLED:
-                await self._unirig.initialize()
-        except Exception as e:
-            logger.warning(f"UniRig initialization failed: {e}")
+        async with pool.init_lock:
+            if pool.init_done.is_set():
+                return
 
-        try:
+            # Warm up both processors in parallel (they handle their own errors)
+            names = []
+            tasks = []
+            if rigging_settings.UNIRIG_ENABLED:
+                names.append("UniRig")
+                tasks.append(self._unirig.initialize())
             if rigging_settings.BLENDER_ENABLED:
-                await self._blender.initialize()
-        except Exception as e:
-            logger.warning(f"Blender initialization failed: {e}")
-
-        self._initialized = True
+                names.append("Blender")
+                tasks.append(self._blender.initialize())
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for name, result in zip(names, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"{name} initialization failed: {result}")
+
+            # Settings may have been reloaded since construction
+            self._dispatch = self._build_dispatch()
+            pool.init_done.set()
+
+    def _build_dispatch(self) -> dict[tuple[CharacterType, RiggingProcessor], BaseRiggingProcessor]:
+        """Precompute the processor for every (character type, requested) pair."""
+        processors = {"unirig": self._unirig, "blender": self._blender}
+        return {
+            (character_type, requested): processors[_choose_processor(
+                character_type,
+                requested,
+                rigging_settings.UNIRIG_ENABLED,
+                rigging_settings.BLENDER_ENABLED,
+            )]
+            for character_type in CharacterType
+            for requested in RiggingProcessor
+        }
 
     async def auto_rig(
         self,
@@ -101,12 +349,14 @@ class RiggingService:
 
         # Detect character type if auto
         if character_type == CharacterType.AUTO:
-            detected_type, confidence = await self.detect_character_type(actual_mesh_path)
-            character_type = detected_type
-            logger.info(f"Detected character type: {character_type} (confidence: {confidence:.2f})")
+            detection = await self.detect_character_type(actual_mesh_path)
+            character_type = detection.character_type
+            logger.info(
+                f"Detected character type: {character_type} (confidence: {detection.confidence:.2f})"
+            )
 
         # Select processor
-        selected_processor = await self._select_processor(character_type, processor)
+        selected_processor = self._select_processor(character_type, processor)
         logger.info(f"Selected processor: {selected_processor.name}")
 
         # Run rigging
@@ -129,6 +379,30 @@ class RiggingService:
         """
         Auto-decimate mesh if it exceeds target vertex count.
 
+        Mesh loading and decimation are blocking trimesh calls, so they run
+        in a worker thread to keep the event loop responsive.
+
+        Returns:
+            Path to decimated mesh (or original if no decimation needed)
+        """
+        return await asyncio.to_thread(
+            self._decimate_if_needed,
+            mesh_path,
+            output_dir,
+            target_vertices,
+            progress_callback,
+        )
+
+    def _decimate_if_needed(
+        self,
+        mesh_path: Path,
+        output_dir: Path,
+        target_vertices: int,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> Path:
+        """
+        Decimate mesh if it exceeds target vertex count (blocking).
+
         Args:
             mesh_path: Original mesh path
             output_dir: Output directory
@@ -189,7 +463,7 @@ class RiggingService:
     async def detect_character_type(
         self,
         mesh_path: Path,
-    ) -> tuple[CharacterType, float]:
+    ) -> CharacterDetection:
         """
         Detect character type from mesh.
 
@@ -197,22 +471,24 @@ class RiggingService:
             mesh_path: Path to mesh file
 
         Returns:
-            Tuple of (detected_type, confidence)
+            CharacterDetection with the detected type and confidence
         """
         await self.initialize()
 
         # Use UniRig for detection (it has the analysis logic)
         try:
-            return await self._unirig.detect_character_type(mesh_path)
+            character_type, confidence = await self._unirig.detect_character_type(mesh_path)
         except Exception as e:
             logger.warning(f"Character detection failed: {e}")
-            return CharacterType.HUMANOID, 0.5
+            return _FALLBACK_DETECTION
 
-    async def _select_processor(
+        return CharacterDetection(character_type, confidence)
+
+    def _select_processor(
         self,
         character_type: CharacterType,
         requested: RiggingProcessor,
-    ) -> "BaseRiggingProcessor":
+    ) -> BaseRiggingProcessor:
         """
         Select appropriate processor.
 
@@ -223,22 +499,7 @@ class RiggingService:
         Returns:
             Selected processor instance
         """
-        if requested == RiggingProcessor.UNIRIG:
-            return self._unirig
-        elif requested == RiggingProcessor.BLENDER:
-            return self._blender
-        else:
-            # Auto-select based on character type and availability
-            if character_type == CharacterType.QUADRUPED:
-                # Blender is better for quadrupeds
-                if rigging_settings.BLENDER_ENABLED:
-                    return self._blender
-                return self._unirig
-            else:
-                # UniRig is faster for humanoids
-                if rigging_settings.UNIRIG_ENABLED:
-                    return self._unirig
-                return self._blender
+        return self._dispatch.get((character_type, requested), self._unirig)
 
     async def get_skeleton(self, asset_id: str) -> Optional[SkeletonData]:
         """
@@ -250,40 +511,50 @@ class RiggingService:
         Returns:
             SkeletonData if asset is rigged, None otherwise
         """
-        if self.db is None:
-            return None
+        skeletons = await self.get_skeletons([asset_id])
+        return skeletons.get(asset_id)
 
-        from ..generation.models import Asset
+    async def get_skeletons(self, asset_ids: list[str]) -> dict[str, SkeletonData]:
+        """
+        Get skeleton data for several assets in one query.
 
-        result = await self.db.execute(
-            select(Asset).where(Asset.id == asset_id)
-        )
-        asset = result.scalar_one_or_none()
+        Args:
+            asset_ids: Asset IDs
 
-        if asset is None or not asset.is_rigged:
-            return None
+        Returns:
+            Mapping of asset ID to SkeletonData for the rigged assets only
+        """
+        if self.db is None or not asset_ids:
+            return {}
 
-        if asset.rigging_data:
-            return SkeletonData(**asset.rigging_data)
+        select, Asset, rigging_json = _lazy_sa()
 
-        return None
+        # Only the columns needed here - skips hydrating full Asset rows.
+        # rigging_data is read as raw JSON text so the fallback path goes
+        # straight through model_validate_json instead of json.loads.
+        result = await self.db.execute(
+            select(Asset.id, Asset.is_rigged, rigging_json, Asset.rigging_blob)
+            .where(Asset.id.in_(asset_ids))
+        )
+
+        return {
+            row.id: parse_skeleton(row.id, row.rigging_json, row.rigging_blob)
+            for row in result
+            if row.is_rigged and has_rigging_data(row.rigging_json, row.rigging_blob)
+        }
 
     def get_templates(self) -> list[SkeletonTemplateInfo]:
         """Get list of available skeleton templates."""
-        return [
-            SkeletonTemplateInfo(
-                name=HUMANOID_TEMPLATE["name"],
-                character_type=CharacterType.HUMANOID,
-                bone_count=HUMANOID_TEMPLATE["bone_count"],
-                description=HUMANOID_TEMPLATE["description"],
-            ),
-            SkeletonTemplateInfo(
-                name=QUADRUPED_TEMPLATE["name"],
-                character_type=CharacterType.QUADRUPED,
-                bone_count=QUADRUPED_TEMPLATE["bone_count"],
-                description=QUADRUPED_TEMPLATE["description"],
-            ),
-        ]
+        return list(_TEMPLATE_INFOS)
+
+    def get_templates_response(self) -> tuple[bytes, str]:
+        """
+        Get the serialized template list and its ETag.
+
+        Returns:
+            Tuple of (JSON body, quoted ETag)
+        """
+        return _TEMPLATE_LIST_JSON, _TEMPLATE_LIST_ETAG
 
     async def export_fbx(
         self,
@@ -316,15 +587,9 @@ class RiggingService:
         )
 
 
-# Global service instance
-_rigging_service: Optional[RiggingService] = None
-
-
-def get_rigging_service(db: Optional[AsyncSession] = None) -> RiggingService:
-    """Get or create rigging service instance."""
-    global _rigging_service
-    if _rigging_service is None:
-        _rigging_service = RiggingService(db)
-    elif db is not None:
-        _rigging_service.db = db
-    return _rigging_service
+# Per-request service. Construction is cheap - processors come from the
+# shared pool - so each request or worker job gets its own service and
+# session; nothing holds a session beyond the caller's scope.
+def get_rigging_service(db: Optional["AsyncSession"] = None) -> RiggingService:
+    """Create a rigging service bound to ``db``."""
+    return RiggingService(db)
@@ -5,19 +5,53 @@ Skeleton data structures and templates.
 from .types import (
     Bone,
     Skeleton,
+    SkeletonArrays,
+    TemplateArrays,
+    build_group_csr,
+    build_group_indices,
+    build_template_arrays,
     create_bone,
+    create_skeleton_from_arrays,
     create_skeleton_from_template,
+    decode_skeleton,
+    encode_skeleton,
+)
+from .humanoid import (
+    HUMANOID_TEMPLATE,
+    HUMANOID_ARRAYS,
+    HUMANOID_NAME_TO_IDX,
+    HUMANOID_BONE_GROUP_INDICES,
+    create_humanoid_skeleton,
+)
+from .quadruped import (
+    QUADRUPED_TEMPLATE,
+    QUADRUPED_ARRAYS,
+    QUADRUPED_NAME_TO_IDX,
+    QUADRUPED_BONE_GROUP_INDICES,
+    create_quadruped_skeleton,
 )
-from .humanoid import HUMANOID_TEMPLATE, create_humanoid_skeleton
-from .quadruped import QUADRUPED_TEMPLATE, create_quadruped_skeleton
 
 __all__ = [
     "Bone",
     "Skeleton",
+    "SkeletonArrays",
+    "TemplateArrays",
+    "build_group_csr",
+    "build_group_indices",
+    "build_template_arrays",
     "create_bone",
+    "create_skeleton_from_arrays",
     "create_skeleton_from_template",
+    "decode_skeleton",
+    "encode_skeleton",
     "HUMANOID_TEMPLATE",
+    "HUMANOID_ARRAYS",
+    "HUMANOID_NAME_TO_IDX",
+    "HUMANOID_BONE_GROUP_INDICES",
     "create_humanoid_skeleton",
     "QUADRUPED_TEMPLATE",
+    "QUADRUPED_ARRAYS",
+    "QUADRUPED_NAME_TO_IDX",
+    "QUADRUPED_BONE_GROUP_INDICES",
     "create_quadruped_skeleton",
 ]
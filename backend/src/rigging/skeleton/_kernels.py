@@ -0,0 +1,155 @@
+"""
+Compiled kernels for skeleton math.
+
+Each kernel is Numba-compiled when Numba is installed and an equivalent
+NumPy implementation otherwise, so callers never need to branch. Use the
+wrappers in ``fk`` and ``Skeleton`` rather than calling these directly.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    from numba import njit, prange
+except ImportError:
+    numba = None
+    njit = None
+    prange = range
+
+HAVE_NUMBA = njit is not None
+
+
+def _apply_groups_impl(group_offsets, group_indices, parent_idx, local_tr, world_tr):
+    # Each group writes only its own rows and reads rows outside every
+    # group (or earlier rows of itself), so groups are independent
+    for g in prange(group_offsets.shape[0] - 1):
+        for n in range(group_offsets[g], group_offsets[g + 1]):
+            i = group_indices[n]
+            parent = parent_idx[i]
+            for r in range(4):
+                a0 = world_tr[parent, r, 0]
+                a1 = world_tr[parent, r, 1]
+                a2 = world_tr[parent, r, 2]
+                a3 = world_tr[parent, r, 3]
+                for c in range(4):
+                    world_tr[i, r, c] = (
+                        a0 * local_tr[i, 0, c]
+                        + a1 * local_tr[i, 1, c]
+                        + a2 * local_tr[i, 2, c]
+                        + a3 * local_tr[i, 3, c]
+                    )
+
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def propagate_world(parent_idx, order, local_tr, out_world):
+        """Compose world transforms, visiting bones in ``order``."""
+        for n in range(order.shape[0]):
+            i = order[n]
+            parent = parent_idx[i]
+            if parent < 0:
+                for r in range(4):
+                    for c in range(4):
+                        out_world[i, r, c] = local_tr[i, r, c]
+                continue
+
+            # Unrolled inner product so LLVM can vectorize the 4x4 matmul
+            for r in range(4):
+                a0 = out_world[parent, r, 0]
+                a1 = out_world[parent, r, 1]
+                a2 = out_world[parent, r, 2]
+                a3 = out_world[parent, r, 3]
+                for c in range(4):
+                    out_world[i, r, c] = (
+                        a0 * local_tr[i, 0, c]
+                        + a1 * local_tr[i, 1, c]
+                        + a2 * local_tr[i, 2, c]
+                        + a3 * local_tr[i, 3, c]
+                    )
+
+    @njit(cache=True, fastmath=True)
+    def scale_translate(heads, tails, scale, offset):
+        """Apply ``v * scale + offset`` to heads and tails in place."""
+        for i in range(heads.shape[0]):
+            for k in range(3):
+                heads[i, k] = heads[i, k] * scale + offset[k]
+                tails[i, k] = tails[i, k] * scale + offset[k]
+
+    @njit(cache=True, fastmath=True)
+    def quat_to_mat4(quats, out):
+        """Write (x, y, z, w) quaternions as 4x4 rotation matrices."""
+        for i in range(quats.shape[0]):
+            x = quats[i, 0]
+            y = quats[i, 1]
+            z = quats[i, 2]
+            w = quats[i, 3]
+            norm = np.sqrt(x * x + y * y + z * z + w * w)
+            x /= norm
+            y /= norm
+            z /= norm
+            w /= norm
+
+            out[i, 0, 0] = 1 - 2 * (y * y + z * z)
+            out[i, 0, 1] = 2 * (x * y - z * w)
+            out[i, 0, 2] = 2 * (x * z + y * w)
+            out[i, 1, 0] = 2 * (x * y + z * w)
+            out[i, 1, 1] = 1 - 2 * (x * x + z * z)
+            out[i, 1, 2] = 2 * (y * z - x * w)
+            out[i, 2, 0] = 2 * (x * z - y * w)
+            out[i, 2, 1] = 2 * (y * z + x * w)
+            out[i, 2, 2] = 1 - 2 * (x * x + y * y)
+            for k in range(3):
+                out[i, k, 3] = 0.0
+                out[i, 3, k] = 0.0
+            out[i, 3, 3] = 1.0
+
+    _apply_groups_parallel = njit(parallel=True, cache=True, fastmath=True)(_apply_groups_impl)
+    # prange degrades to range without parallel=True; used on single-core hosts
+    _apply_groups_serial = njit(cache=True, fastmath=True)(_apply_groups_impl)
+
+    def apply_groups(group_offsets, group_indices, parent_idx, local_tr, world_tr):
+        """Compose world transforms for independent bone groups."""
+        if numba.config.NUMBA_NUM_THREADS > 1:
+            _apply_groups_parallel(group_offsets, group_indices, parent_idx, local_tr, world_tr)
+        else:
+            _apply_groups_serial(group_offsets, group_indices, parent_idx, local_tr, world_tr)
+
+else:
+    def propagate_world(parent_idx, order, local_tr, out_world):
+        """Compose world transforms, visiting bones in ``order``."""
+        for i in order:
+            parent = parent_idx[i]
+            if parent < 0:
+                out_world[i] = local_tr[i]
+            else:
+                np.matmul(out_world[parent], local_tr[i], out=out_world[i])
+
+    def scale_translate(heads, tails, scale, offset):
+        """Apply ``v * scale + offset`` to heads and tails in place."""
+        heads *= scale
+        heads += offset
+        tails *= scale
+        tails += offset
+
+    def quat_to_mat4(quats, out):
+        """Write (x, y, z, w) quaternions as 4x4 rotation matrices."""
+        q = quats / np.linalg.norm(quats, axis=1, keepdims=True)
+        x, y, z, w = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+        out[:] = 0
+        out[:, 0, 0] = 1 - 2 * (y * y + z * z)
+        out[:, 0, 1] = 2 * (x * y - z * w)
+        out[:, 0, 2] = 2 * (x * z + y * w)
+        out[:, 1, 0] = 2 * (x * y + z * w)
+        out[:, 1, 1] = 1 - 2 * (x * x + z * z)
+        out[:, 1, 2] = 2 * (y * z - x * w)
+        out[:, 2, 0] = 2 * (x * z - y * w)
+        out[:, 2, 1] = 2 * (y * z + x * w)
+        out[:, 2, 2] = 1 - 2 * (x * x + y * y)
+        out[:, 3, 3] = 1.0
+
+    def apply_groups(group_offsets, group_indices, parent_idx, local_tr, world_tr):
+        """Compose world transforms for independent bone groups."""
+        for g in range(len(group_offsets) - 1):
+            for i in group_indices[group_offsets[g]:group_offsets[g + 1]]:
+                np.matmul(world_tr[parent_idx[i]], local_tr[i], out=world_tr[i])
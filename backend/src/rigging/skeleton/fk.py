@@ -0,0 +1,108 @@
+"""
+Forward kinematics for struct-of-arrays skeletons.
+
+Composes per-bone local transforms into world transforms. The loops
+themselves live in ``_kernels``, which compiles them with Numba when it
+is installed and falls back to NumPy otherwise.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ._kernels import apply_groups, propagate_world, quat_to_mat4
+
+
+def compute_world_matrices(
+    parent_idx: np.ndarray,
+    local_tr: np.ndarray,
+    out_world: np.ndarray,
+    order: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compose local bone transforms into world transforms.
+
+    Args:
+        parent_idx: (N,) parent index per bone, -1 for roots
+        local_tr: (N, 4, 4) float32 local transforms
+        out_world: (N, 4, 4) float32 output buffer
+        order: Bone indices with every parent before its children. Omit
+            when bones are already stored parents-first
+            (``parent_idx[i] < i``), e.g. skeletons and templates, which
+            are kept in depth-first order; the pass is then one forward
+            sweep over contiguous rows.
+
+    Returns:
+        ``out_world``
+    """
+    parent_idx = np.ascontiguousarray(parent_idx, dtype=np.int32)
+    if order is None:
+        order = np.arange(len(parent_idx), dtype=np.int64)
+    else:
+        order = np.ascontiguousarray(order, dtype=np.int64)
+
+    propagate_world(parent_idx, order, local_tr, out_world)
+    return out_world
+
+
+def apply_group_transforms(
+    group_offsets: np.ndarray,
+    group_indices: np.ndarray,
+    parent_idx: np.ndarray,
+    local_tr: np.ndarray,
+    world_tr: np.ndarray,
+) -> np.ndarray:
+    """
+    Recompute world transforms for independent bone groups in parallel.
+
+    Groups are stored CSR-style: group ``g`` is
+    ``group_indices[group_offsets[g]:group_offsets[g + 1]]``, parents first.
+    World transforms of bones outside the groups (e.g. the spine) must
+    already be up to date in ``world_tr``.
+
+    Args:
+        group_offsets: (G + 1,) int32 offsets into ``group_indices``
+        group_indices: (M,) int32 bone indices
+        parent_idx: (N,) parent index per bone
+        local_tr: (N, 4, 4) float32 local transforms
+        world_tr: (N, 4, 4) float32 world transforms, updated in place
+
+    Returns:
+        ``world_tr``
+    """
+    parent_idx = np.ascontiguousarray(parent_idx, dtype=np.int32)
+
+    apply_groups(group_offsets, group_indices, parent_idx, local_tr, world_tr)
+    return world_tr
+
+
+def build_local_matrices(
+    heads: np.ndarray,
+    rotations: np.ndarray,
+    parent_idx: np.ndarray,
+) -> np.ndarray:
+    """
+    Build local bone transforms from rest-pose heads and rotations.
+
+    Each bone's translation is its head relative to its parent's head
+    (absolute for roots).
+
+    Args:
+        heads: (N, 3) bone head positions
+        rotations: (N, 4) bone rotation quaternions (x, y, z, w)
+        parent_idx: (N,) parent index per bone, -1 for roots
+
+    Returns:
+        (N, 4, 4) float32 local transforms
+    """
+    count = len(heads)
+    parent_idx = np.asarray(parent_idx)
+    has_parent = parent_idx >= 0
+
+    offsets = np.array(heads, dtype=np.float32)
+    offsets[has_parent] -= heads[parent_idx[has_parent]]
+
+    local_tr = np.empty((count, 4, 4), dtype=np.float32)
+    quat_to_mat4(np.ascontiguousarray(rotations, dtype=np.float32), local_tr)
+    local_tr[:, :3, 3] = offsets
+    return local_tr
@@ -5,11 +5,23 @@ Standard humanoid rig compatible with Mixamo, Unity Humanoid, and Unreal Mannequ
 Bone naming follows industry conventions for maximum compatibility.
 """
 
+import functools
+
+import numpy as np
+
 from ..schemas import CharacterType
-from .types import Skeleton, create_skeleton_from_template
+from .types import (
+    DTYPE,
+    Skeleton,
+    build_group_csr,
+    build_group_indices,
+    build_template_arrays,
+    create_skeleton_from_arrays,
+)
 
 # Humanoid skeleton template with 65 bones
 # Positions are normalized (0-2 units height, centered at origin)
+# Only the left side is listed; Right* bones are mirrored from it below
 HUMANOID_TEMPLATE = {
     "name": "Humanoid",
     "description": "Standard humanoid skeleton for bipedal characters",
@@ -54,48 +66,83 @@ HUMANOID_TEMPLATE = {
         {"name": "LeftHandPinky2", "parent": "LeftHandPinky1", "head": (0.78, 1.48, -0.03), "tail": (0.81, 1.48, -0.03), "connected": True},
         {"name": "LeftHandPinky3", "parent": "LeftHandPinky2", "head": (0.81, 1.48, -0.03), "tail": (0.83, 1.48, -0.03), "connected": True},
 
-        # Right Arm
-        {"name": "RightShoulder", "parent": "Spine2", "head": (-0.05, 1.48, 0), "tail": (-0.15, 1.48, 0)},
-        {"name": "RightArm", "parent": "RightShoulder", "head": (-0.15, 1.48, 0), "tail": (-0.4, 1.48, 0), "connected": True},
-        {"name": "RightForeArm", "parent": "RightArm", "head": (-0.4, 1.48, 0), "tail": (-0.65, 1.48, 0), "connected": True},
-        {"name": "RightHand", "parent": "RightForeArm", "head": (-0.65, 1.48, 0), "tail": (-0.75, 1.48, 0), "connected": True},
-
-        # Right Hand Fingers
-        {"name": "RightHandThumb1", "parent": "RightHand", "head": (-0.68, 1.48, 0.02), "tail": (-0.71, 1.48, 0.04)},
-        {"name": "RightHandThumb2", "parent": "RightHandThumb1", "head": (-0.71, 1.48, 0.04), "tail": (-0.74, 1.48, 0.05), "connected": True},
-        {"name": "RightHandThumb3", "parent": "RightHandThumb2", "head": (-0.74, 1.48, 0.05), "tail": (-0.76, 1.48, 0.06), "connected": True},
-
-        {"name": "RightHandIndex1", "parent": "RightHand", "head": (-0.75, 1.48, 0.015), "tail": (-0.80, 1.48, 0.015), "connected": True},
-        {"name": "RightHandIndex2", "parent": "RightHandIndex1", "head": (-0.80, 1.48, 0.015), "tail": (-0.84, 1.48, 0.015), "connected": True},
-        {"name": "RightHandIndex3", "parent": "RightHandIndex2", "head": (-0.84, 1.48, 0.015), "tail": (-0.87, 1.48, 0.015), "connected": True},
-
-        {"name": "RightHandMiddle1", "parent": "RightHand", "head": (-0.75, 1.48, 0), "tail": (-0.81, 1.48, 0), "connected": True},
-        {"name": "RightHandMiddle2", "parent": "RightHandMiddle1", "head": (-0.81, 1.48, 0), "tail": (-0.86, 1.48, 0), "connected": True},
-        {"name": "RightHandMiddle3", "parent": "RightHandMiddle2", "head": (-0.86, 1.48, 0), "tail": (-0.89, 1.48, 0), "connected": True},
-
-        {"name": "RightHandRing1", "parent": "RightHand", "head": (-0.75, 1.48, -0.015), "tail": (-0.80, 1.48, -0.015), "connected": True},
-        {"name": "RightHandRing2", "parent": "RightHandRing1", "head": (-0.80, 1.48, -0.015), "tail": (-0.84, 1.48, -0.015), "connected": True},
-        {"name": "RightHandRing3", "parent": "RightHandRing2", "head": (-0.84, 1.48, -0.015), "tail": (-0.87, 1.48, -0.015), "connected": True},
-
-        {"name": "RightHandPinky1", "parent": "RightHand", "head": (-0.75, 1.48, -0.03), "tail": (-0.78, 1.48, -0.03), "connected": True},
-        {"name": "RightHandPinky2", "parent": "RightHandPinky1", "head": (-0.78, 1.48, -0.03), "tail": (-0.81, 1.48, -0.03), "connected": True},
-        {"name": "RightHandPinky3", "parent": "RightHandPinky2", "head": (-0.81, 1.48, -0.03), "tail": (-0.83, 1.48, -0.03), "connected": True},
-
         # Left Leg
         {"name": "LeftUpLeg", "parent": "Hips", "head": (0.1, 1.0, 0), "tail": (0.1, 0.55, 0)},
         {"name": "LeftLeg", "parent": "LeftUpLeg", "head": (0.1, 0.55, 0), "tail": (0.1, 0.1, 0), "connected": True},
         {"name": "LeftFoot", "parent": "LeftLeg", "head": (0.1, 0.1, 0), "tail": (0.1, 0.05, 0.1), "connected": True},
         {"name": "LeftToeBase", "parent": "LeftFoot", "head": (0.1, 0.05, 0.1), "tail": (0.1, 0.02, 0.18), "connected": True},
-
-        # Right Leg
-        {"name": "RightUpLeg", "parent": "Hips", "head": (-0.1, 1.0, 0), "tail": (-0.1, 0.55, 0)},
-        {"name": "RightLeg", "parent": "RightUpLeg", "head": (-0.1, 0.55, 0), "tail": (-0.1, 0.1, 0), "connected": True},
-        {"name": "RightFoot", "parent": "RightLeg", "head": (-0.1, 0.1, 0), "tail": (-0.1, 0.05, 0.1), "connected": True},
-        {"name": "RightToeBase", "parent": "RightFoot", "head": (-0.1, 0.05, 0.1), "tail": (-0.1, 0.02, 0.18), "connected": True},
     ],
 }
 
 
+def _mirror_left_side(bone_defs: list[dict]) -> list[dict]:
+    """
+    Insert the mirrored Right* bones after each run of Left* bones.
+
+    The mirror negates X for every left bone in one array operation.
+
+    Args:
+        bone_defs: Bone definitions with only the left side present
+
+    Returns:
+        Bone definitions with both sides, right runs following left runs
+    """
+    left_defs = [bone_def for bone_def in bone_defs if bone_def["name"].startswith("Left")]
+    coords = np.array([(bone_def["head"], bone_def["tail"]) for bone_def in left_defs], dtype=DTYPE)
+    coords[..., 0] *= -1
+
+    mirrored = []
+    for bone_def, (head, tail) in zip(left_defs, coords.tolist()):
+        parent = bone_def["parent"]
+        if parent.startswith("Left"):
+            parent = "Right" + parent[4:]
+        mirrored.append(dict(
+            bone_def,
+            name="Right" + bone_def["name"][4:],
+            parent=parent,
+            head=tuple(head),
+            tail=tuple(tail),
+        ))
+
+    # A run ends at the first non-left bone or at a left bone hanging off
+    # the center line (the start of the next limb)
+    result = []
+    pending = []
+    right_defs = iter(mirrored)
+    for bone_def in bone_defs:
+        is_left = bone_def["name"].startswith("Left")
+        if pending and (not is_left or not bone_def["parent"].startswith("Left")):
+            result.extend(pending)
+            pending.clear()
+        if is_left:
+            pending.append(next(right_defs))
+        result.append(bone_def)
+    result.extend(pending)
+    return result
+
+
+HUMANOID_TEMPLATE["bones"] = _mirror_left_side(HUMANOID_TEMPLATE["bones"])
+
+# Struct-of-arrays form of the template, built once at import
+HUMANOID_ARRAYS = build_template_arrays(HUMANOID_TEMPLATE)
+HUMANOID_NAME_TO_IDX = {name: i for i, name in enumerate(HUMANOID_ARRAYS.names)}
+
+# Expose the packed arrays on the template itself; "bones" stays for
+# callers that still read the list-of-dicts form
+HUMANOID_TEMPLATE.update(
+    coords=HUMANOID_ARRAYS.coords,
+    names=HUMANOID_ARRAYS.names,
+    parents=HUMANOID_ARRAYS.parent_idx,
+    flags=HUMANOID_ARRAYS.flags,
+)
+
+
+@functools.cache
+def _humanoid_prototype() -> Skeleton:
+    """Build the humanoid skeleton once; callers get clones of it."""
+    return create_skeleton_from_arrays(HUMANOID_ARRAYS, CharacterType.HUMANOID)
+
+
 def create_humanoid_skeleton() -> Skeleton:
     """
     Create a standard humanoid skeleton from template.
@@ -103,7 +150,7 @@ def create_humanoid_skeleton() -> Skeleton:
     Returns:
         Skeleton configured for humanoid characters
     """
-    return create_skeleton_from_template(HUMANOID_TEMPLATE, CharacterType.HUMANOID)
+    return _humanoid_prototype().clone()
 
 
 # Bone groups for easier manipulation
@@ -129,6 +176,21 @@ HUMANOID_BONE_GROUPS = {
     "right_leg": ["RightUpLeg", "RightLeg", "RightFoot", "RightToeBase"],
 }
 
+# Group members as template indices, for gathering rows of bone arrays
+HUMANOID_BONE_GROUP_INDICES = build_group_indices(HUMANOID_BONE_GROUPS, HUMANOID_NAME_TO_IDX)
+
+# Bone groups that hang off the spine without touching each other, so their
+# world transforms can be posed in parallel (see fk.apply_group_transforms)
+HUMANOID_LIMB_CHAINS = (
+    ("left_arm", "left_hand"),
+    ("right_arm", "right_hand"),
+    ("left_leg",),
+    ("right_leg",),
+)
+HUMANOID_GROUP_OFFSETS, HUMANOID_GROUP_INDICES = build_group_csr(
+    HUMANOID_LIMB_CHAINS, HUMANOID_BONE_GROUP_INDICES, HUMANOID_ARRAYS.parent_idx
+)
+
 # Key bones for fitting skeleton to mesh
 HUMANOID_LANDMARK_BONES = {
     "root": "Hips",
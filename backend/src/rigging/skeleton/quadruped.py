@@ -4,8 +4,16 @@ Quadruped skeleton template.
 Standard quadruped rig for four-legged creatures (dogs, cats, horses, etc.).
 """
 
+import functools
+
 from ..schemas import CharacterType
-from .types import Skeleton, create_skeleton_from_template
+from .types import (
+    Skeleton,
+    build_group_csr,
+    build_group_indices,
+    build_template_arrays,
+    create_skeleton_from_arrays,
+)
 
 # Quadruped skeleton template with 45 bones
 # Positions are normalized for a medium-sized quadruped
@@ -72,6 +80,26 @@ QUADRUPED_TEMPLATE = {
 }
 
 
+# Struct-of-arrays form of the template, built once at import
+QUADRUPED_ARRAYS = build_template_arrays(QUADRUPED_TEMPLATE)
+QUADRUPED_NAME_TO_IDX = {name: i for i, name in enumerate(QUADRUPED_ARRAYS.names)}
+
+# Expose the packed arrays on the template itself; "bones" stays for
+# callers that still read the list-of-dicts form
+QUADRUPED_TEMPLATE.update(
+    coords=QUADRUPED_ARRAYS.coords,
+    names=QUADRUPED_ARRAYS.names,
+    parents=QUADRUPED_ARRAYS.parent_idx,
+    flags=QUADRUPED_ARRAYS.flags,
+)
+
+
+@functools.cache
+def _quadruped_prototype() -> Skeleton:
+    """Build the quadruped skeleton once; callers get clones of it."""
+    return create_skeleton_from_arrays(QUADRUPED_ARRAYS, CharacterType.QUADRUPED)
+
+
 def create_quadruped_skeleton() -> Skeleton:
     """
     Create a standard quadruped skeleton from template.
@@ -79,7 +107,7 @@ def create_quadruped_skeleton() -> Skeleton:
     Returns:
         Skeleton configured for quadruped creatures
     """
-    return create_skeleton_from_template(QUADRUPED_TEMPLATE, CharacterType.QUADRUPED)
+    return _quadruped_prototype().clone()
 
 
 # Bone groups for easier manipulation
@@ -94,6 +122,23 @@ QUADRUPED_BONE_GROUPS = {
     "back_right_leg": ["RightBackHip", "RightBackUpperLeg", "RightBackLowerLeg", "RightBackPaw", "RightBackToes"],
 }
 
+# Group members as template indices, for gathering rows of bone arrays
+QUADRUPED_BONE_GROUP_INDICES = build_group_indices(QUADRUPED_BONE_GROUPS, QUADRUPED_NAME_TO_IDX)
+
+# Bone groups that hang off the spine without touching each other, so their
+# world transforms can be posed in parallel (see fk.apply_group_transforms)
+QUADRUPED_LIMB_CHAINS = (
+    ("neck_head", "ears"),
+    ("tail",),
+    ("front_left_leg",),
+    ("front_right_leg",),
+    ("back_left_leg",),
+    ("back_right_leg",),
+)
+QUADRUPED_GROUP_OFFSETS, QUADRUPED_GROUP_INDICES = build_group_csr(
+    QUADRUPED_LIMB_CHAINS, QUADRUPED_BONE_GROUP_INDICES, QUADRUPED_ARRAYS.parent_idx
+)
+
 # Key bones for fitting skeleton to mesh
 QUADRUPED_LANDMARK_BONES = {
     "root": "Hips",
@@ -2,30 +2,150 @@
 Core skeleton data types and utilities.
 """
 
+import math
+import struct
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import ClassVar, NamedTuple, Optional
 import numpy as np
 
 from ..schemas import BoneData, SkeletonData, CharacterType
+from ._kernels import scale_translate
+from .fk import build_local_matrices, compute_world_matrices
+
+
+# Float type for bone vectors - ample for rig math, and what GPU skinning uses
+DTYPE = np.float32
+
+# Shared read-only defaults for standalone bones; Bone copies them on init
+_ZERO3 = np.zeros(3, dtype=DTYPE)
+_DEFAULT_TAIL = np.array([0.0, 0.1, 0.0], dtype=DTYPE)
+_UNIT_QUAT = np.array([0.0, 0.0, 0.0, 1.0], dtype=DTYPE)
+_ONES3 = np.ones(3, dtype=DTYPE)
+for _default in (_ZERO3, _DEFAULT_TAIL, _UNIT_QUAT, _ONES3):
+    _default.setflags(write=False)
 
 
-@dataclass
 class Bone:
-    """Runtime bone representation."""
-    name: str
-    parent: Optional["Bone"] = None
-    children: list["Bone"] = field(default_factory=list)
-    head: np.ndarray = field(default_factory=lambda: np.array([0.0, 0.0, 0.0]))
-    tail: np.ndarray = field(default_factory=lambda: np.array([0.0, 0.1, 0.0]))
-    rotation: np.ndarray = field(default_factory=lambda: np.array([0.0, 0.0, 0.0, 1.0]))
-    scale: np.ndarray = field(default_factory=lambda: np.array([1.0, 1.0, 1.0]))
-    connected: bool = False
-    deform: bool = True
-
-    # Transform matrices (computed)
-    local_matrix: Optional[np.ndarray] = None
-    world_matrix: Optional[np.ndarray] = None
-    bind_matrix: Optional[np.ndarray] = None
+    """
+    Runtime bone representation.
+
+    A bone owned by a Skeleton is a view: ``head``, ``tail``, ``rotation``
+    and ``scale`` are rows of the skeleton's struct-of-arrays buffers, and
+    assigning to them writes into those rows in place.
+    """
+
+    __slots__ = (
+        "name",
+        "parent",
+        "children",
+        "connected",
+        "deform",
+        "local_matrix",
+        "world_matrix",
+        "bind_matrix",
+        "_head",
+        "_tail",
+        "_rotation",
+        "_scale",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Bone"] = None,
+        children: Optional[list["Bone"]] = None,
+        head=_ZERO3,
+        tail=_DEFAULT_TAIL,
+        rotation=_UNIT_QUAT,
+        scale=_ONES3,
+        connected: bool = False,
+        deform: bool = True,
+        local_matrix: Optional[np.ndarray] = None,
+        world_matrix: Optional[np.ndarray] = None,
+        bind_matrix: Optional[np.ndarray] = None,
+    ):
+        self.name = name
+        self.parent = parent
+        self.children = children if children is not None else []
+        self._head = np.array(head, dtype=DTYPE)
+        self._tail = np.array(tail, dtype=DTYPE)
+        self._rotation = np.array(rotation, dtype=DTYPE)
+        self._scale = np.array(scale, dtype=DTYPE)
+        self.connected = connected
+        self.deform = deform
+
+        # Transform matrices (computed)
+        self.local_matrix = local_matrix
+        self.world_matrix = world_matrix
+        self.bind_matrix = bind_matrix
+
+    @classmethod
+    def _view(
+        cls,
+        name: str,
+        head: np.ndarray,
+        tail: np.ndarray,
+        rotation: np.ndarray,
+        scale: np.ndarray,
+        connected: bool,
+        deform: bool,
+    ) -> "Bone":
+        """Create a bone over existing buffer rows, without copying."""
+        bone = cls.__new__(cls)
+        bone.name = name
+        bone.parent = None
+        bone.children = []
+        bone._head = head
+        bone._tail = tail
+        bone._rotation = rotation
+        bone._scale = scale
+        bone.connected = connected
+        bone.deform = deform
+        bone.local_matrix = None
+        bone.world_matrix = None
+        bone.bind_matrix = None
+        return bone
+
+    def __repr__(self) -> str:
+        parent = self.parent.name if self.parent else None
+        return f"Bone(name={self.name!r}, parent={parent!r}, head={self._head}, tail={self._tail})"
+
+    @property
+    def head(self) -> np.ndarray:
+        """Head position (x, y, z)."""
+        return self._head
+
+    @head.setter
+    def head(self, value) -> None:
+        self._head[...] = value
+
+    @property
+    def tail(self) -> np.ndarray:
+        """Tail position (x, y, z)."""
+        return self._tail
+
+    @tail.setter
+    def tail(self, value) -> None:
+        self._tail[...] = value
+
+    @property
+    def rotation(self) -> np.ndarray:
+        """Rotation quaternion (x, y, z, w)."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value) -> None:
+        self._rotation[...] = value
+
+    @property
+    def scale(self) -> np.ndarray:
+        """Scale (x, y, z)."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, value) -> None:
+        self._scale[...] = value
 
     def add_child(self, child: "Bone") -> None:
         """Add a child bone."""
@@ -35,48 +155,376 @@ class Bone:
     @property
     def length(self) -> float:
         """Get bone length."""
-        return float(np.linalg.norm(self.tail - self.head))
+        # Scalar math: np.linalg.norm's dispatch dominates for 3 elements
+        dx, dy, dz = (self._tail - self._head).tolist()
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
 
     @property
     def direction(self) -> np.ndarray:
         """Get normalized bone direction."""
-        diff = self.tail - self.head
-        length = np.linalg.norm(diff)
+        diff = self._tail - self._head
+        dx, dy, dz = diff.tolist()
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
         if length > 0:
             return diff / length
-        return np.array([0.0, 1.0, 0.0])
+        return np.array([0.0, 1.0, 0.0], dtype=DTYPE)
 
     def to_bone_data(self) -> BoneData:
         """Convert to Pydantic BoneData."""
+        # Pydantic coerces lists to the tuple fields; no extra tuple() copy
         return BoneData(
             name=self.name,
             parent=self.parent.name if self.parent else None,
-            head_position=tuple(self.head.tolist()),
-            tail_position=tuple(self.tail.tolist()),
-            rotation=tuple(self.rotation.tolist()),
-            scale=tuple(self.scale.tolist()),
+            head_position=self._head.tolist(),
+            tail_position=self._tail.tolist(),
+            rotation=self._rotation.tolist(),
+            scale=self._scale.tolist(),
             connected=self.connected,
             deform=self.deform,
         )
 
 
+# Bit flags packed into TemplateArrays.flags
+FLAG_CONNECTED = 1 << 0
+FLAG_DEFORM = 1 << 1
+
+
+class TemplateArrays(NamedTuple):
+    """
+    Read-only struct-of-arrays form of a skeleton template.
+
+    Built once at import from a template's bone list. Rows are in
+    depth-first order, so ``parent_idx[i] < i``; row ``i`` of every array
+    describes bone ``names[i]``.
+    """
+    names: tuple[str, ...]
+    heads: np.ndarray       # (N, 3) float32, view of coords[:, 0]
+    tails: np.ndarray       # (N, 3) float32, view of coords[:, 1]
+    parent_idx: np.ndarray  # (N,) int16, -1 for the root
+    flags: np.ndarray       # (N,) uint8, FLAG_CONNECTED | FLAG_DEFORM
+    coords: np.ndarray      # (N, 2, 3) float32, head and tail per bone
+
+
 @dataclass
+class SkeletonArrays:
+    """
+    Struct-of-arrays view of a skeleton for vectorized bone math.
+
+    Row ``i`` of every array describes bone ``names[i]``. Root bones have a
+    parent index of -1.
+    """
+    names: tuple[str, ...]
+    head: np.ndarray        # (N, 3) float32
+    tail: np.ndarray        # (N, 3) float32
+    rot: np.ndarray         # (N, 4) float32 quaternions (x, y, z, w)
+    parent_idx: np.ndarray  # (N,) int32
+
+    @property
+    def bone_count(self) -> int:
+        """Get total bone count."""
+        return len(self.names)
+
+    @classmethod
+    def from_skeleton_data(cls, data: SkeletonData) -> "SkeletonArrays":
+        """Build arrays from a SkeletonData wire model."""
+        bones = data.bones
+        names = tuple(b.name for b in bones)
+        name_to_idx = {name: i for i, name in enumerate(names)}
+
+        return cls(
+            names=names,
+            head=np.array([b.head_position for b in bones], dtype=np.float32).reshape(-1, 3),
+            tail=np.array([b.tail_position for b in bones], dtype=np.float32).reshape(-1, 3),
+            rot=np.array([b.rotation for b in bones], dtype=np.float32).reshape(-1, 4),
+            parent_idx=np.array(
+                [name_to_idx.get(b.parent, -1) if b.parent else -1 for b in bones],
+                dtype=np.int32,
+            ),
+        )
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "SkeletonArrays":
+        """
+        Build arrays from an ``encode_skeleton`` blob without copying.
+
+        The arrays are read-only views into ``blob``; copy before mutating.
+        """
+        layout = _decode_skeleton_blob(blob)
+        return cls(
+            names=layout["names"],
+            head=layout["head"],
+            tail=layout["tail"],
+            rot=layout["rot"],
+            parent_idx=layout["parent_idx"],
+        )
+
+
+# Binary skeleton format: 16-byte header, NUL-separated UTF-8 names padded
+# to 4 bytes, then head/tail/rotation/scale float32, parent int32, flags uint8
+SKELETON_BLOB_MAGIC = b"SWSK"
+SKELETON_BLOB_VERSION = 1
+_BLOB_HEADER = struct.Struct("<4sBBHII")  # magic, version, type, root, count, names_len
+_CHARACTER_TYPES = tuple(CharacterType)
+
+
+def encode_skeleton(data: SkeletonData) -> bytes:
+    """
+    Pack skeleton data into a compact binary blob.
+
+    Coordinates are stored as float32.
+
+    Args:
+        data: Skeleton to encode
+
+    Returns:
+        Encoded bytes, readable with ``decode_skeleton``
+
+    Raises:
+        ValueError: If the skeleton has a bind pose (not representable)
+    """
+    if data.bind_pose:
+        raise ValueError("bind_pose is not supported by the binary skeleton format")
+
+    bones = data.bones
+    count = len(bones)
+    names = tuple(bone.name for bone in bones)
+    name_to_idx = {name: i for i, name in enumerate(names)}
+
+    names_blob = "\0".join(names).encode("utf-8")
+    padding = b"\0" * (-len(names_blob) % 4)
+
+    parent_idx = np.array(
+        [name_to_idx.get(bone.parent, -1) if bone.parent else -1 for bone in bones],
+        dtype=np.int32,
+    )
+    flags = np.array(
+        [
+            (FLAG_CONNECTED if bone.connected else 0) | (FLAG_DEFORM if bone.deform else 0)
+            for bone in bones
+        ],
+        dtype=np.uint8,
+    )
+
+    header = _BLOB_HEADER.pack(
+        SKELETON_BLOB_MAGIC,
+        SKELETON_BLOB_VERSION,
+        _CHARACTER_TYPES.index(data.character_type),
+        name_to_idx.get(data.root_bone, 0),
+        count,
+        len(names_blob),
+    )
+
+    return b"".join((
+        header,
+        names_blob,
+        padding,
+        np.array([bone.head_position for bone in bones], dtype=np.float32).tobytes(),
+        np.array([bone.tail_position for bone in bones], dtype=np.float32).tobytes(),
+        np.array([bone.rotation for bone in bones], dtype=np.float32).tobytes(),
+        np.array([bone.scale for bone in bones], dtype=np.float32).tobytes(),
+        parent_idx.tobytes(),
+        flags.tobytes(),
+    ))
+
+
+def _decode_skeleton_blob(blob: bytes) -> dict:
+    """Split an encoded skeleton into header fields and array views."""
+    magic, version, type_idx, root_idx, count, names_len = _BLOB_HEADER.unpack_from(blob)
+    if magic != SKELETON_BLOB_MAGIC:
+        raise ValueError("Not an encoded skeleton")
+    if version != SKELETON_BLOB_VERSION:
+        raise ValueError(f"Unsupported skeleton blob version {version}")
+
+    offset = _BLOB_HEADER.size
+    names = tuple(bytes(blob[offset:offset + names_len]).decode("utf-8").split("\0")) if count else ()
+    offset += names_len + (-names_len % 4)
+
+    def take(dtype, *shape):
+        nonlocal offset
+        array = np.frombuffer(blob, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+        offset += array.nbytes
+        return array
+
+    return {
+        "character_type": _CHARACTER_TYPES[type_idx],
+        "root_idx": root_idx,
+        "names": names,
+        "head": take(np.float32, count, 3),
+        "tail": take(np.float32, count, 3),
+        "rot": take(np.float32, count, 4),
+        "scale": take(np.float32, count, 3),
+        "parent_idx": take(np.int32, count),
+        "flags": take(np.uint8, count),
+    }
+
+
+def decode_skeleton(blob: bytes) -> SkeletonData:
+    """
+    Unpack a blob produced by ``encode_skeleton``.
+
+    Args:
+        blob: Encoded skeleton bytes
+
+    Returns:
+        Decoded SkeletonData
+
+    Raises:
+        ValueError: If the blob is not a supported encoded skeleton
+    """
+    layout = _decode_skeleton_blob(blob)
+    names = layout["names"]
+    parents = layout["parent_idx"].tolist()
+    flags = layout["flags"].tolist()
+
+    bones = [
+        BoneData(
+            name=name,
+            parent=names[parent] if parent >= 0 else None,
+            head_position=tuple(head),
+            tail_position=tuple(tail),
+            rotation=tuple(rot),
+            scale=tuple(scale),
+            connected=bool(flag & FLAG_CONNECTED),
+            deform=bool(flag & FLAG_DEFORM),
+        )
+        for name, parent, head, tail, rot, scale, flag in zip(
+            names,
+            parents,
+            layout["head"].tolist(),
+            layout["tail"].tolist(),
+            layout["rot"].tolist(),
+            layout["scale"].tolist(),
+            flags,
+        )
+    ]
+
+    return SkeletonData(
+        root_bone=names[layout["root_idx"]] if names else "",
+        bones=bones,
+        character_type=layout["character_type"],
+        bone_count=len(bones),
+    )
+
+
+def _depth_first(root: Bone) -> list[Bone]:
+    """Collect bones root first, depth-first, without recursion."""
+    result = []
+    stack = [root]
+    while stack:
+        bone = stack.pop()
+        result.append(bone)
+        stack.extend(reversed(bone.children))
+    return result
+
+
+@dataclass(slots=True)
 class Skeleton:
-    """Complete skeleton structure."""
+    """
+    Complete skeleton structure.
+
+    Bone data lives in struct-of-arrays buffers (row ``i`` describes bone
+    ``_names[i]``, in ``bones`` order); each Bone's vectors are views into
+    these rows. Bones are kept in depth-first order, so
+    ``_parent_idx[i] < i`` and transforms propagate in one forward pass.
+    The buffers and order are fixed at construction, so build a new
+    Skeleton after changing the hierarchy.
+    """
+    DTYPE: ClassVar[type] = DTYPE
+
     root: Bone
     bones: dict[str, Bone] = field(default_factory=dict)
     character_type: CharacterType = CharacterType.HUMANOID
 
+    _names: list[str] = field(init=False, repr=False)
+    _name_to_idx: dict[str, int] = field(init=False, repr=False)
+    _heads: np.ndarray = field(init=False, repr=False)        # (N, 3) DTYPE
+    _tails: np.ndarray = field(init=False, repr=False)        # (N, 3) DTYPE
+    _rotations: np.ndarray = field(init=False, repr=False)    # (N, 4) DTYPE
+    _scales: np.ndarray = field(init=False, repr=False)       # (N, 3) DTYPE
+    _parent_idx: np.ndarray = field(init=False, repr=False)   # (N,) int32, -1 for roots
+    _dfs_bones: list[Bone] = field(init=False, repr=False)    # root first, depth-first
+
     def __post_init__(self):
-        """Build bone dictionary after initialization."""
-        if not self.bones:
-            self._build_bone_dict(self.root)
+        """Build bone dictionary and pack bones into shared buffers."""
+        self._dfs_bones = _depth_first(self.root)
+
+        # Reorder depth-first; extra roots (if any) follow the main tree
+        ordered = {bone.name: bone for bone in self._dfs_bones}
+        for bone in self.bones.values():
+            if bone.parent is None and bone.name not in ordered:
+                ordered.update((b.name, b) for b in _depth_first(bone))
+        self.bones = ordered
+
+        self._pack_bones()
+
+    def _pack_bones(self) -> None:
+        """Copy bone vectors into SoA buffers and rebind bones as row views."""
+        bones = list(self.bones.values())
+        self._names = list(self.bones)
+        self._name_to_idx = {name: i for i, name in enumerate(self._names)}
+
+        self._heads = np.array([bone.head for bone in bones], dtype=DTYPE).reshape(-1, 3)
+        self._tails = np.array([bone.tail for bone in bones], dtype=DTYPE).reshape(-1, 3)
+        self._rotations = np.array([bone.rotation for bone in bones], dtype=DTYPE).reshape(-1, 4)
+        self._scales = np.array([bone.scale for bone in bones], dtype=DTYPE).reshape(-1, 3)
+        self._parent_idx = np.array(
+            [self._name_to_idx[bone.parent.name] if bone.parent else -1 for bone in bones],
+            dtype=np.int32,
+        )
 
-    def _build_bone_dict(self, bone: Bone) -> None:
-        """Recursively build bone dictionary."""
-        self.bones[bone.name] = bone
-        for child in bone.children:
-            self._build_bone_dict(child)
+        for i, bone in enumerate(bones):
+            bone._head = self._heads[i]
+            bone._tail = self._tails[i]
+            bone._rotation = self._rotations[i]
+            bone._scale = self._scales[i]
+
+    @classmethod
+    def _from_buffers(
+        cls,
+        names: list[str],
+        parent_idx: np.ndarray,
+        heads: np.ndarray,
+        tails: np.ndarray,
+        rotations: np.ndarray,
+        scales: np.ndarray,
+        connected: list[bool],
+        deform: list[bool],
+        character_type: CharacterType,
+    ) -> "Skeleton":
+        """
+        Build a skeleton that takes ownership of ready-made SoA buffers.
+
+        Bones are created directly as views, so nothing is stacked or copied.
+        Rows must already be depth-first (``parent_idx[i] < i``).
+        """
+        bones = [
+            Bone._view(name, heads[i], tails[i], rotations[i], scales[i], connected[i], deform[i])
+            for i, name in enumerate(names)
+        ]
+
+        root = None
+        for bone, parent in zip(bones, parent_idx.tolist()):
+            if parent >= 0:
+                bones[parent].add_child(bone)
+            elif root is None:
+                root = bone
+
+        if root is None:
+            raise ValueError("No root bone found")
+
+        skeleton = cls.__new__(cls)
+        skeleton.root = root
+        skeleton.bones = dict(zip(names, bones))
+        skeleton.character_type = character_type
+        skeleton._names = list(names)
+        skeleton._name_to_idx = {name: i for i, name in enumerate(names)}
+        skeleton._heads = heads
+        skeleton._tails = tails
+        skeleton._rotations = rotations
+        skeleton._scales = scales
+        skeleton._parent_idx = parent_idx
+        skeleton._dfs_bones = _depth_first(root)
+        return skeleton
 
     def get_bone(self, name: str) -> Optional[Bone]:
         """Get bone by name."""
@@ -84,24 +532,88 @@ class Skeleton:
 
     def get_all_bones(self) -> list[Bone]:
         """Get all bones in order (root first, depth-first)."""
-        result = []
-        self._collect_bones(self.root, result)
-        return result
-
-    def _collect_bones(self, bone: Bone, result: list[Bone]) -> None:
-        """Recursively collect bones."""
-        result.append(bone)
-        for child in bone.children:
-            self._collect_bones(child, result)
+        return list(self._dfs_bones)
 
     @property
     def bone_count(self) -> int:
         """Get total bone count."""
         return len(self.bones)
 
+    def bone_lengths(self) -> np.ndarray:
+        """
+        Get every bone's length in one vectorized pass.
+
+        Returns:
+            (N,) float32 lengths, in ``bones`` order
+        """
+        diff = self._tails - self._heads
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+    def clone(self) -> "Skeleton":
+        """
+        Create an independent copy of this skeleton.
+
+        Bone buffers are copied so the clone can be scaled or posed without
+        touching the original. The topology arrays are shared.
+        """
+        bones = list(self.bones.values())
+        return Skeleton._from_buffers(
+            self._names,
+            self._parent_idx,
+            self._heads.copy(),
+            self._tails.copy(),
+            self._rotations.copy(),
+            self._scales.copy(),
+            [bone.connected for bone in bones],
+            [bone.deform for bone in bones],
+            self.character_type,
+        )
+
+    def compute_pose(self) -> np.ndarray:
+        """
+        Compute local and world transforms for every bone.
+
+        Fills each bone's ``local_matrix`` and ``world_matrix``.
+
+        Returns:
+            (N, 4, 4) float32 world matrices, in ``bones`` order
+        """
+        # Rows are depth-first, so one forward pass resolves every parent
+        parent_idx = self._parent_idx
+        local_tr = build_local_matrices(self._heads, self._rotations, parent_idx)
+        world = compute_world_matrices(parent_idx, local_tr, np.empty_like(local_tr))
+
+        for i, bone in enumerate(self.bones.values()):
+            bone.local_matrix = local_tr[i]
+            bone.world_matrix = world[i]
+
+        return world
+
     def to_skeleton_data(self) -> SkeletonData:
         """Convert to Pydantic SkeletonData."""
-        bones = [bone.to_bone_data() for bone in self.get_all_bones()]
+        names = self._names
+        parents = self._parent_idx.tolist()
+        heads = self._heads.tolist()
+        tails = self._tails.tolist()
+        rotations = self._rotations.tolist()
+        scales = self._scales.tolist()
+        bone_list = list(self.bones.values())
+
+        bones = []
+        for bone in self._dfs_bones:
+            i = self._name_to_idx[bone.name]
+            parent = parents[i]
+            bones.append(BoneData(
+                name=names[i],
+                parent=names[parent] if parent >= 0 else None,
+                head_position=heads[i],
+                tail_position=tails[i],
+                rotation=rotations[i],
+                scale=scales[i],
+                connected=bone_list[i].connected,
+                deform=bone_list[i].deform,
+            ))
+
         return SkeletonData(
             root_bone=self.root.name,
             bones=bones,
@@ -109,6 +621,31 @@ class Skeleton:
             bone_count=len(bones),
         )
 
+    def to_skeleton_data_fast(self) -> dict:
+        """
+        Convert to a column-oriented dict without building BoneData models.
+
+        Each per-bone list is in ``bones`` order; ``parents`` holds parent
+        row indices (-1 for roots). Zip the columns to get per-bone records.
+
+        Returns:
+            JSON-ready dict of the skeleton's columns
+        """
+        bones = self.bones.values()
+        return {
+            "root_bone": self.root.name,
+            "names": list(self._names),
+            "parents": self._parent_idx.tolist(),
+            "heads": self._heads.tolist(),
+            "tails": self._tails.tolist(),
+            "rotations": self._rotations.tolist(),
+            "scales": self._scales.tolist(),
+            "connected": [bone.connected for bone in bones],
+            "deform": [bone.deform for bone in bones],
+            "character_type": self.character_type.value,
+            "bone_count": len(self._names),
+        }
+
     def scale_to_mesh(self, mesh_height: float, mesh_center: np.ndarray) -> None:
         """
         Scale and position skeleton to fit a mesh.
@@ -117,20 +654,14 @@ class Skeleton:
             mesh_height: Height of the mesh bounding box
             mesh_center: Center of the mesh bounding box
         """
-        # Calculate current skeleton height
-        all_bones = self.get_all_bones()
-        if not all_bones:
+        heads = self._heads
+        tails = self._tails
+        if len(heads) == 0:
             return
 
         # Find skeleton bounds
-        all_positions = []
-        for bone in all_bones:
-            all_positions.append(bone.head)
-            all_positions.append(bone.tail)
-
-        positions = np.array(all_positions)
-        skeleton_min = positions.min(axis=0)
-        skeleton_max = positions.max(axis=0)
+        skeleton_min = np.minimum(heads.min(axis=0), tails.min(axis=0))
+        skeleton_max = np.maximum(heads.max(axis=0), tails.max(axis=0))
         skeleton_height = skeleton_max[1] - skeleton_min[1]  # Y is up
 
         if skeleton_height <= 0:
@@ -139,13 +670,11 @@ class Skeleton:
         # Calculate scale factor
         scale_factor = mesh_height / skeleton_height
 
-        # Scale and translate all bones
+        # Scale and translate all bones in place (bone vectors are views)
         skeleton_center = (skeleton_min + skeleton_max) / 2
-        offset = mesh_center - skeleton_center * scale_factor
+        offset = np.asarray(mesh_center) - skeleton_center * scale_factor
 
-        for bone in all_bones:
-            bone.head = bone.head * scale_factor + offset
-            bone.tail = bone.tail * scale_factor + offset
+        scale_translate(heads, tails, float(scale_factor), offset)
 
 
 def create_bone(
@@ -170,10 +699,11 @@ def create_bone(
     Returns:
         New Bone instance
     """
+    # Bone copies its inputs, so pass the tuples straight through
     bone = Bone(
         name=name,
-        head=np.array(head),
-        tail=np.array(tail),
+        head=head,
+        tail=tail,
         connected=connected,
         deform=deform,
     )
@@ -182,46 +712,212 @@ def create_bone(
     return bone
 
 
-def create_skeleton_from_template(
-    template: dict,
+def build_template_arrays(template: dict) -> TemplateArrays:
+    """
+    Convert a template's bone list into read-only struct-of-arrays form.
+
+    Rows are reordered depth-first, so they may differ from the order of
+    the template's bone list.
+
+    Args:
+        template: Template with bone definitions
+
+    Returns:
+        TemplateArrays with write-protected buffers
+    """
+    bone_defs = template["bones"]
+    count = len(bone_defs)
+
+    # One pass over the definitions; parent names are resolved afterwards
+    names = []
+    parent_names = []
+    coord_rows = []
+    flag_values = []
+    for bone_def in bone_defs:
+        names.append(sys.intern(bone_def["name"]))
+        parent_names.append(bone_def.get("parent"))
+        coord_rows.append((bone_def["head"], bone_def["tail"]))
+        flag_values.append(
+            (FLAG_CONNECTED if bone_def.get("connected", False) else 0)
+            | (FLAG_DEFORM if bone_def.get("deform", True) else 0)
+        )
+
+    name_to_idx = dict(zip(names, range(count)))
+    try:
+        parent_idx = np.fromiter(
+            (-1 if parent_name is None else name_to_idx[parent_name] for parent_name in parent_names),
+            dtype=np.int16,
+            count=count,
+        )
+    except KeyError as exc:
+        parent_name = exc.args[0]
+        child = names[parent_names.index(parent_name)]
+        raise ValueError(f"Unknown parent bone '{parent_name}' for '{child}'") from None
+
+    coords = np.array(coord_rows, dtype=np.float32).reshape(count, 2, 3)
+    flags = np.array(flag_values, dtype=np.uint8)
+
+    # Store rows depth-first so every parent precedes its children
+    order = depth_first_order(parent_idx)
+    remap = np.empty(count, dtype=np.int16)
+    remap[order] = np.arange(count, dtype=np.int16)
+
+    names = tuple(names[i] for i in order.tolist())
+    coords = np.ascontiguousarray(coords[order])
+    flags = flags[order]
+    parent_idx = parent_idx[order]
+    parent_idx[parent_idx >= 0] = remap[parent_idx[parent_idx >= 0]]
+
+    for array in (coords, parent_idx, flags):
+        array.setflags(write=False)
+
+    return TemplateArrays(names, coords[:, 0], coords[:, 1], parent_idx, flags, coords)
+
+
+def build_group_indices(
+    groups: dict[str, list[str]],
+    name_to_idx: dict[str, int],
+) -> dict[str, np.ndarray]:
+    """
+    Resolve named bone groups to index arrays.
+
+    Args:
+        groups: Group name to list of bone names
+        name_to_idx: Bone name to template index
+
+    Returns:
+        Group name to read-only int32 index array
+    """
+    indices = {}
+    for group, bone_names in groups.items():
+        idx = np.fromiter((name_to_idx[name] for name in bone_names), dtype=np.int32, count=len(bone_names))
+        idx.setflags(write=False)
+        indices[group] = idx
+    return indices
+
+
+def build_group_csr(
+    chains: tuple[tuple[str, ...], ...],
+    group_indices: dict[str, np.ndarray],
+    parent_idx: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten bone-group chains into CSR arrays for parallel posing.
+
+    Each chain concatenates one or more groups. Chains must be independent:
+    a bone's parent is either earlier in the same chain or outside every
+    chain.
+
+    Args:
+        chains: Group names per chain, parents first
+        group_indices: Group name to bone index array
+        parent_idx: (N,) parent index per bone
+
+    Returns:
+        Tuple of (offsets, indices), both read-only int32
+
+    Raises:
+        ValueError: If a chain depends on another chain
+    """
+    members = [np.concatenate([group_indices[group] for group in chain]) for chain in chains]
+
+    owner = np.full(len(parent_idx), -1, dtype=np.int32)
+    for c, idx in enumerate(members):
+        owner[idx] = c
+
+    for c, idx in enumerate(members):
+        seen = set()
+        for i in idx.tolist():
+            parent = int(parent_idx[i])
+            if parent >= 0 and owner[parent] != -1 and (owner[parent] != c or parent not in seen):
+                raise ValueError(f"Bone chain {chains[c]} is not independent at bone index {i}")
+            seen.add(i)
+
+    offsets = np.zeros(len(members) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(idx) for idx in members])
+    indices = np.concatenate(members).astype(np.int32)
+
+    offsets.setflags(write=False)
+    indices.setflags(write=False)
+    return offsets, indices
+
+
+def depth_first_order(parent_idx: np.ndarray) -> np.ndarray:
+    """
+    Order bone indices depth-first (pre-order), roots in index order.
+
+    Reindexing bones by this order guarantees ``parent_idx[i] < i``.
+
+    Args:
+        parent_idx: Parent index per bone (-1 for roots)
+
+    Returns:
+        (N,) intp permutation of bone indices
+    """
+    parents = parent_idx.tolist()
+    children = [[] for _ in parents]
+    roots = []
+    for i, parent in enumerate(parents):
+        (children[parent] if parent >= 0 else roots).append(i)
+
+    order = []
+    stack = roots[::-1]
+    while stack:
+        i = stack.pop()
+        order.append(i)
+        stack.extend(reversed(children[i]))
+
+    if len(order) != len(parents):
+        raise ValueError("Bone hierarchy contains a cycle")
+
+    return np.asarray(order, dtype=np.intp)
+
+
+def create_skeleton_from_arrays(
+    arrays: TemplateArrays,
     character_type: CharacterType,
 ) -> Skeleton:
     """
-    Create a skeleton from a template dictionary.
+    Create a skeleton from precomputed template arrays.
 
     Args:
-        template: Template with bone definitions
+        arrays: Struct-of-arrays template
         character_type: Character type
 
     Returns:
         Skeleton instance
     """
-    bones_by_name: dict[str, Bone] = {}
-    root_bone = None
-
-    # First pass: create all bones
-    for bone_def in template["bones"]:
-        bone = Bone(
-            name=bone_def["name"],
-            head=np.array(bone_def["head"]),
-            tail=np.array(bone_def["tail"]),
-            connected=bone_def.get("connected", False),
-            deform=bone_def.get("deform", True),
-        )
-        bones_by_name[bone.name] = bone
+    count = len(arrays.names)
+    flags = arrays.flags.tolist()
+
+    rotations = np.zeros((count, 4), dtype=DTYPE)
+    rotations[:, 3] = 1.0
+
+    return Skeleton._from_buffers(
+        list(arrays.names),
+        arrays.parent_idx.astype(np.int32),
+        arrays.heads.astype(DTYPE),
+        arrays.tails.astype(DTYPE),
+        rotations,
+        np.ones((count, 3), dtype=DTYPE),
+        [bool(flag & FLAG_CONNECTED) for flag in flags],
+        [bool(flag & FLAG_DEFORM) for flag in flags],
+        character_type,
+    )
 
-        if bone_def.get("parent") is None:
-            root_bone = bone
 
-    # Second pass: set up parent-child relationships
-    for bone_def in template["bones"]:
-        bone = bones_by_name[bone_def["name"]]
-        parent_name = bone_def.get("parent")
-        if parent_name and parent_name in bones_by_name:
-            parent = bones_by_name[parent_name]
-            parent.add_child(bone)
+def create_skeleton_from_template(
+    template: dict,
+    character_type: CharacterType,
+) -> Skeleton:
+    """
+    Create a skeleton from a template dictionary.
 
-    if root_bone is None:
-        raise ValueError("No root bone found in template")
+    Args:
+        template: Template with bone definitions
+        character_type: Character type
 
-    return Skeleton(root=root_bone, bones=bones_by_name, character_type=character_type)
+    Returns:
+        Skeleton instance
+    """
+    return create_skeleton_from_arrays(build_template_arrays(template), character_type)
@@ -8,13 +8,49 @@ Checks VRAM usage at various stages to identify:
 4. Potential memory leaks
 """
 
+import functools
 import logging
 import gc
+import subprocess
 import sys
-from typing import Dict, List, Tuple, Optional
+import time
+from typing import Any, Callable, Dict, List, Tuple, Optional
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
 
 logger = logging.getLogger(__name__)
 
+# nvidia-smi takes 100-300 ms to start, so rapid polls reuse recent results
+GPU_QUERY_TTL_SECONDS = 0.5
+_gpu_query_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+def _cached_gpu_query(key: str, fetch: Callable[[], Any]) -> Any:
+    """Return ``fetch()``, reusing a result younger than the TTL."""
+    now = time.monotonic()
+    hit = _gpu_query_cache.get(key)
+    if hit is not None and now - hit[0] < GPU_QUERY_TTL_SECONDS:
+        return hit[1]
+    value = fetch()
+    _gpu_query_cache[key] = (now, value)
+    return value
+
+
+@functools.cache
+def _nvml_handle():
+    """Initialize NVML once and return the handle for GPU 0, or None."""
+    if pynvml is None:
+        return None
+    try:
+        pynvml.nvmlInit()
+        return pynvml.nvmlDeviceGetHandleByIndex(0)
+    except Exception as e:
+        logger.debug(f"NVML unavailable, using nvidia-smi: {e}")
+        return None
+
 
 def get_vram_info() -> Dict:
     """Get detailed VRAM information."""
@@ -52,9 +88,31 @@ def get_vram_info() -> Dict:
 
 
 def get_nvidia_smi_info() -> Dict:
-    """Get VRAM info from nvidia-smi (includes all processes)."""
+    """
+    Get system-wide VRAM info (includes all processes).
+
+    Uses NVML when pynvml is installed and nvidia-smi otherwise. Results
+    are cached for ``GPU_QUERY_TTL_SECONDS``.
+    """
+    return dict(_cached_gpu_query("memory", _query_gpu_memory))
+
+
+def _query_gpu_memory() -> Dict:
+    handle = _nvml_handle()
+    if handle is not None:
+        try:
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            return {
+                "available": True,
+                "used_gb": mem.used / 1024**3,
+                "total_gb": mem.total / 1024**3,
+                "free_gb": mem.free / 1024**3,
+                "source": "nvml (all processes)"
+            }
+        except Exception as e:
+            logger.debug(f"NVML memory query failed: {e}")
+
     try:
-        import subprocess
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=memory.used,memory.total,memory.free", "--format=csv,noheader,nounits"],
             capture_output=True,
@@ -79,9 +137,37 @@ def get_nvidia_smi_info() -> Dict:
 
 
 def get_gpu_processes() -> List[Dict]:
-    """Get list of processes using GPU."""
+    """
+    Get list of processes using GPU.
+
+    Uses NVML when pynvml is installed and nvidia-smi otherwise. Results
+    are cached for ``GPU_QUERY_TTL_SECONDS``.
+    """
+    return list(_cached_gpu_query("processes", _query_gpu_processes))
+
+
+def _query_gpu_processes() -> List[Dict]:
+    handle = _nvml_handle()
+    if handle is not None:
+        try:
+            processes = []
+            for proc in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+                try:
+                    name = pynvml.nvmlSystemGetProcessName(proc.pid)
+                except Exception:
+                    name = "unknown"
+                if isinstance(name, bytes):
+                    name = name.decode(errors="replace")
+                processes.append({
+                    "pid": str(proc.pid),
+                    "name": name,
+                    "memory_mb": (proc.usedGpuMemory or 0) // (1024 * 1024)
+                })
+            return processes
+        except Exception as e:
+            logger.debug(f"NVML process query failed: {e}")
+
     try:
-        import subprocess
         result = subprocess.run(
             ["nvidia-smi", "--query-compute-apps=pid,process_name,used_memory", "--format=csv,noheader,nounits"],
             capture_output=True,
@@ -104,11 +190,34 @@ def get_gpu_processes() -> List[Dict]:
         return [{"error": str(e)}]
 
 
-def analyze_pytorch_tensors() -> Dict:
-    """Analyze PyTorch tensors currently in memory."""
+def analyze_pytorch_tensors(verbose: bool = False) -> Dict:
+    """
+    Analyze PyTorch tensors currently in memory.
+
+    By default totals come from the CUDA caching allocator's stats. Walking
+    every live Python object to find individual tensors can take hundreds
+    of milliseconds on a running server, so it only happens when
+    ``verbose`` is set.
+
+    Args:
+        verbose: Also scan ``gc.get_objects()`` for per-tensor details
+
+    Returns:
+        Dict with ``cuda_allocation_count`` and ``cuda_total_mb``; in
+        verbose mode also tensor counts and the ten largest CUDA tensors
+    """
     try:
         import torch
 
+        if not verbose:
+            if not torch.cuda.is_available():
+                return {"cuda_allocation_count": 0, "cuda_total_mb": 0.0}
+            stats = torch.cuda.memory_stats(0)
+            return {
+                "cuda_allocation_count": stats.get("allocation.all.current", 0),
+                "cuda_total_mb": stats.get("allocated_bytes.all.current", 0) / 1e6,
+            }
+
         # Count tensors by device
         cuda_tensors = []
         cpu_tensors = []
@@ -136,6 +245,7 @@ def analyze_pytorch_tensors() -> Dict:
         cuda_tensors.sort(key=lambda x: x["size_mb"], reverse=True)
 
         return {
+            "cuda_allocation_count": len(cuda_tensors),
             "cuda_tensor_count": len(cuda_tensors),
             "cpu_tensor_count": len(cpu_tensors),
             "cuda_total_mb": sum(t["size_mb"] for t in cuda_tensors),
@@ -145,50 +255,71 @@ def analyze_pytorch_tensors() -> Dict:
         return {"error": str(e)}
 
 
+# Module-level attributes known to hold models, pipelines or caches
+KNOWN_CACHE_SITES: Dict[str, Tuple[str, ...]] = {
+    "src.inference.pipeline": ("_pipeline",),
+    "src.rigging.service": ("_skeleton_cache",),
+    "src.rigging.router": ("_skeleton_response_cache",),
+}
+
+
 def check_module_caches() -> Dict:
-    """Check for cached models in loaded modules."""
+    """
+    Check for cached models in loaded modules.
+
+    Probes ``KNOWN_CACHE_SITES`` directly, then looks for objects with a
+    ``.to()`` method (models, pipelines) in loaded hy3dgen modules. Module
+    namespaces are read with ``vars()``, which avoids building and sorting
+    a ``dir()`` listing and resolving descriptors for every attribute.
+    """
     caches_found = []
 
     try:
-        for name, module in list(sys.modules.items()):
+        for name, attrs in KNOWN_CACHE_SITES.items():
+            module = sys.modules.get(name)
             if module is None:
                 continue
-
-            # Check for common cache patterns
-            cache_attrs = ['_cache', 'cache', '_model', 'model', '_pipeline', 'pipeline']
-            for attr in cache_attrs:
-                if hasattr(module, attr):
-                    obj = getattr(module, attr, None)
-                    if obj is not None:
-                        caches_found.append({
-                            "module": name,
-                            "attribute": attr,
-                            "type": type(obj).__name__,
-                        })
-
-            # Check for hy3dgen specifically
-            if 'hy3dgen' in name:
-                for attr_name in dir(module):
-                    if not attr_name.startswith('_'):
-                        try:
-                            attr = getattr(module, attr_name, None)
-                            if hasattr(attr, 'to') and callable(getattr(attr, 'to', None)):
-                                caches_found.append({
-                                    "module": name,
-                                    "attribute": attr_name,
-                                    "type": type(attr).__name__,
-                                    "has_cuda": "possibly"
-                                })
-                        except:
-                            pass
+            namespace = vars(module)
+            for attr in attrs:
+                obj = namespace.get(attr)
+                if obj is not None:
+                    caches_found.append({
+                        "module": name,
+                        "attribute": attr,
+                        "type": type(obj).__name__,
+                    })
+
+        # hy3dgen holds its models in attributes we don't know in advance
+        for name, module in list(sys.modules.items()):
+            if module is None or 'hy3dgen' not in name:
+                continue
+            for attr_name, attr in list(vars(module).items()):
+                if attr_name.startswith('_'):
+                    continue
+                try:
+                    has_to = callable(getattr(attr, 'to', None))
+                except Exception:
+                    continue
+                if has_to:
+                    caches_found.append({
+                        "module": name,
+                        "attribute": attr_name,
+                        "type": type(attr).__name__,
+                        "has_cuda": "possibly"
+                    })
     except Exception as e:
         return {"error": str(e)}
 
     return {"caches_found": caches_found, "count": len(caches_found)}
 
 
-def full_diagnostic() -> Dict:
-    """Run full VRAM diagnostic."""
+def full_diagnostic(verbose: bool = False) -> Dict:
+    """
+    Run full VRAM diagnostic.
+
+    Args:
+        verbose: List individual CUDA tensors (walks every Python object)
+    """
     print("\n" + "="*60)
     print("VRAM DIAGNOSTIC REPORT")
     print("="*60)
@@ -231,11 +362,14 @@ def full_diagnostic() -> Dict:
     # 4. Tensor analysis
     print("\n[4] PyTorch Tensor Analysis")
     print("-" * 40)
-    tensor_info = analyze_pytorch_tensors()
+    tensor_info = analyze_pytorch_tensors(verbose=verbose)
     if not tensor_info.get("error"):
-        print(f"  CUDA Tensors: {tensor_info['cuda_tensor_count']}")
+        if verbose:
+            print(f"  CUDA Tensors: {tensor_info['cuda_tensor_count']}")
+        else:
+            print(f"  CUDA Allocations: {tensor_info['cuda_allocation_count']}")
         print(f"  CUDA Total:   {tensor_info['cuda_total_mb']:.1f} MB")
-        if tensor_info['top_cuda_tensors']:
+        if tensor_info.get('top_cuda_tensors'):
             print("  Top CUDA Tensors:")
             for t in tensor_info['top_cuda_tensors'][:5]:
                 print(f"    - {t['shape']} ({t['dtype']}): {t['size_mb']:.1f} MB")
@@ -273,7 +407,7 @@ def full_diagnostic() -> Dict:
             print(f"\n  WARNING: High non-PyTorch usage ({other_usage:.1f} GB)")
             print("  This could be: Windows DWM, other apps, or driver overhead")
 
-        if pytorch_allocated > 1.0 and tensor_info.get('cuda_tensor_count', 0) < 10:
+        if verbose and pytorch_allocated > 1.0 and tensor_info.get('cuda_tensor_count', 0) < 10:
             print(f"\n  WARNING: {pytorch_allocated:.1f} GB allocated but few tensors visible")
             print("  This suggests memory held by compiled CUDA kernels or cached models")
 
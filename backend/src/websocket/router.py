@@ -1,18 +1,89 @@
 """WebSocket router for real-time updates."""
 
-import json
 import logging
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from src.core.queue import get_queue
-from src.core.websocket_manager import get_websocket_manager
+from src.core.queue import JobQueue, get_queue
+from src.core.websocket_manager import (
+    WebSocketManager,
+    error_payload,
+    get_websocket_manager,
+    progress_payload,
+    queue_status_payload,
+)
+
+from .schemas import PONG_JSON
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+async def _handle_subscribe(
+    websocket: WebSocket,
+    message: dict,
+    ws_manager: WebSocketManager,
+    queue: JobQueue,
+) -> None:
+    """Subscribe to a job and send its current status if it exists."""
+    job_id = message.get("job_id")
+    if not job_id:
+        return
+
+    await ws_manager.subscribe(websocket, job_id)
+
+    job = queue.get_job(job_id)
+    if job:
+        await websocket.send_text(progress_payload(
+            job.id, job.progress, job.stage, job.status.value
+        ))
+
+
+async def _handle_unsubscribe(
+    websocket: WebSocket,
+    message: dict,
+    ws_manager: WebSocketManager,
+    queue: JobQueue,
+) -> None:
+    """Unsubscribe from a job."""
+    job_id = message.get("job_id")
+    if job_id:
+        await ws_manager.unsubscribe(websocket, job_id)
+
+
+async def _handle_request_status(
+    websocket: WebSocket,
+    message: dict,
+    ws_manager: WebSocketManager,
+    queue: JobQueue,
+) -> None:
+    """Send the current queue status."""
+    await websocket.send_text(
+        queue_status_payload(queue.get_status())
+    )
+
+
+async def _handle_ping(
+    websocket: WebSocket,
+    message: dict,
+    ws_manager: WebSocketManager,
+    queue: JobQueue,
+) -> None:
+    """Reply to a keepalive ping."""
+    await websocket.send_text(PONG_JSON)
+
+
+# Client action -> handler
+_ACTION_HANDLERS = {
+    "subscribe": _handle_subscribe,
+    "unsubscribe": _handle_unsubscribe,
+    "request_status": _handle_request_status,
+    "ping": _handle_ping,
+}
+
+
 @router.websocket("/progress")
 async def websocket_progress_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time progress updates.
@@ -48,59 +119,29 @@ async def websocket_progress_endpoint(websocket: WebSocket):
 
     try:
         # Send initial queue status
-        await websocket.send_json({
-            "type": "queue_status",
-            **queue.get_status(),
-        })
+        await websocket.send_text(
+            queue_status_payload(queue.get_status())
+        )
 
         while True:
             # Receive messages from client
             data = await websocket.receive_text()
 
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 action = message.get("action")
 
-                if action == "subscribe":
-                    job_id = message.get("job_id")
-                    if job_id:
-                        await ws_manager.subscribe(websocket, job_id)
-
-                        # Send current job status if exists
-                        job = queue.get_job(job_id)
-                        if job:
-                            await websocket.send_json({
-                                "type": "progress",
-                                "job_id": job.id,
-                                "progress": job.progress,
-                                "stage": job.stage,
-                                "status": job.status.value,
-                            })
-
-                elif action == "unsubscribe":
-                    job_id = message.get("job_id")
-                    if job_id:
-                        await ws_manager.unsubscribe(websocket, job_id)
-
-                elif action == "request_status":
-                    await websocket.send_json({
-                        "type": "queue_status",
-                        **queue.get_status(),
-                    })
-
-                elif action == "ping":
-                    await websocket.send_json({"type": "pong"})
-
+                handler = _ACTION_HANDLERS.get(action)
+                if handler is not None:
+                    await handler(websocket, message, ws_manager, queue)
                 else:
                     logger.warning(f"Unknown WebSocket action: {action}")
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.warning(f"Invalid JSON received: {data}")
-                await websocket.send_json({
-                    "type": "error",
-                    "code": "invalid_json",
-                    "message": "Invalid JSON format",
-                })
+                await websocket.send_text(
+                    error_payload("invalid_json", "Invalid JSON format")
+                )
 
     except WebSocketDisconnect:
         logger.debug("WebSocket client disconnected")
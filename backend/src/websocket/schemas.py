@@ -1,6 +1,6 @@
 """WebSocket message schemas."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
@@ -16,6 +16,7 @@ class MessageType(str, Enum):
     ASSET_READY = "asset_ready"
     ERROR = "error"
     PONG = "pong"
+    WORKFLOW_UPDATE = "workflow_update"
 
     # Client -> Server
     SUBSCRIBE = "subscribe"
@@ -24,6 +25,11 @@ class MessageType(str, Enum):
     PING = "ping"
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware current UTC time (``datetime.utcnow`` is naive)."""
+    return datetime.now(timezone.utc)
+
+
 # Server -> Client Messages
 
 class ProgressMessage(BaseModel):
@@ -35,7 +41,7 @@ class ProgressMessage(BaseModel):
     status: str  # pending, processing, completed, failed
     result: Optional[dict] = None
     error: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class QueueStatusMessage(BaseModel):
@@ -47,7 +53,8 @@ class QueueStatusMessage(BaseModel):
     processing_count: int
     completed_count: int
     failed_count: int = 0
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    total_jobs: int = 0
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class JobCreatedMessage(BaseModel):
@@ -57,7 +64,7 @@ class JobCreatedMessage(BaseModel):
     asset_id: str
     job_type: str
     queue_position: int
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class AssetReadyMessage(BaseModel):
@@ -67,7 +74,22 @@ class AssetReadyMessage(BaseModel):
     name: str
     thumbnail_url: Optional[str] = None
     download_url: Optional[str] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
+
+
+class WorkflowUpdateMessage(BaseModel):
+    """Workflow stage change for an asset."""
+    type: str = Field(default=MessageType.WORKFLOW_UPDATE)
+    asset_id: str
+    stage: str
+    status: str  # advanced, approved, skipped_to_export
+    progress: float = Field(default=0.0, ge=0.0, le=1.0)
+    message: str = ""
+    timestamp: datetime = Field(default_factory=_utcnow)
+
+
+# Constant payload, so it is encoded once rather than per ping
+PONG_JSON = '{"type":"pong"}'
 
 
 class ErrorMessage(BaseModel):
@@ -77,7 +99,7 @@ class ErrorMessage(BaseModel):
     message: str
     job_id: Optional[str] = None
     details: Optional[dict] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 # Client -> Server Messages
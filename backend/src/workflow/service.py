@@ -2,15 +2,17 @@
 
 import logging
 from typing import Optional
-from sqlalchemy import select
+
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.websocket_manager import get_websocket_manager, send_in_background
 from src.generation.models import Asset, WorkflowStage
 
 logger = logging.getLogger(__name__)
 
 # Stage progression order
-STAGE_ORDER = [
+STAGE_ORDER: tuple[WorkflowStage, ...] = (
     WorkflowStage.UPLOADED,
     WorkflowStage.MESH_GENERATED,
     WorkflowStage.MESH_APPROVED,
@@ -18,43 +20,110 @@ STAGE_ORDER = [
     WorkflowStage.TEXTURE_APPROVED,
     WorkflowStage.RIGGED,
     WorkflowStage.EXPORTED,
-]
+)
+
+# First and final stages, bound once for the per-request paths
+_UPLOADED = WorkflowStage.UPLOADED
+_EXPORTED = WorkflowStage.EXPORTED
+
+
+# Transition tables derived from STAGE_ORDER, so lookups are O(1)
+STAGE_INDEX: dict[WorkflowStage, int] = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+NEXT_STAGE: dict[WorkflowStage, WorkflowStage] = dict(zip(STAGE_ORDER, STAGE_ORDER[1:]))
+PREV_STAGE: dict[WorkflowStage, WorkflowStage] = dict(zip(STAGE_ORDER[1:], STAGE_ORDER))
+EXPORT_IDX = STAGE_INDEX[_EXPORTED]
+
+# Stage names passed over when skipping to export from each stage
+SKIPPED_TO_EXPORT: dict[WorkflowStage, tuple[str, ...]] = {
+    stage: tuple(later.value for later in STAGE_ORDER[i + 1:EXPORT_IDX])
+    for i, stage in enumerate(STAGE_ORDER)
+}
+
+
+# Status texts, formatted once per stage. The frontend shows the WebSocket
+# message_text as workflow progress, and the HTTP message is part of the
+# response schemas, so both stay.
+_ADVANCED_MESSAGES = {stage: f"Advanced to {stage.value}" for stage in STAGE_ORDER}
+_APPROVED_MESSAGES = {stage: f"Stage {stage.value} approved" for stage in STAGE_ORDER}
+_APPROVED_UPDATE_MESSAGES = {
+    stage: f"Stage {stage.value} approved, now at {next_stage.value}"
+    for stage, next_stage in NEXT_STAGE.items()
+}
+_SKIPPED_MESSAGES = {
+    stage: f"Skipped stages: {', '.join(skipped)}"
+    for stage, skipped in SKIPPED_TO_EXPORT.items()
+}
 
 
 def get_next_stage(current: WorkflowStage) -> Optional[WorkflowStage]:
     """Get the next stage in the workflow."""
-    try:
-        idx = STAGE_ORDER.index(current)
-        if idx < len(STAGE_ORDER) - 1:
-            return STAGE_ORDER[idx + 1]
-    except ValueError:
-        pass
-    return None
+    return NEXT_STAGE.get(current)
 
 
 def get_prev_stage(current: WorkflowStage) -> Optional[WorkflowStage]:
     """Get the previous stage in the workflow."""
-    try:
-        idx = STAGE_ORDER.index(current)
-        if idx > 0:
-            return STAGE_ORDER[idx - 1]
-    except ValueError:
-        pass
-    return None
+    return PREV_STAGE.get(current)
 
 
 class WorkflowService:
     """Service for managing asset workflow progression."""
 
+    __slots__ = ("db", "_assets")
+
     def __init__(self, db: AsyncSession):
         self.db = db
+        # The session's identity map holds instances weakly; keep loaded
+        # assets alive so later calls on this service reuse them
+        self._assets: dict[str, Asset] = {}
 
     async def get_asset(self, asset_id: str) -> Optional[Asset]:
-        """Get an asset by ID."""
+        """Get an asset by ID.
+
+        An asset already loaded in this session comes from the identity map
+        without a query. This relies on the session factory's
+        ``expire_on_commit=False``; otherwise every commit would expire the
+        cached instance and force a reload.
+        """
+        asset = await self.db.get(Asset, asset_id)
+        if asset is not None:
+            self._assets[asset_id] = asset
+        return asset
+
+    async def _get_stage(self, asset_id: str) -> Optional[WorkflowStage]:
+        """Get an asset's workflow stage without loading the full row.
+
+        Returns:
+            The current stage, or None if the asset doesn't exist
+        """
+        # Reuse an asset this service already loaded (see get_asset)
+        cached = self._assets.get(asset_id)
+        if cached is not None:
+            return cached.workflow_stage or _UPLOADED
+
         result = await self.db.execute(
-            select(Asset).where(Asset.id == asset_id)
+            select(Asset.workflow_stage).where(Asset.id == asset_id)
         )
-        return result.scalar_one_or_none()
+        row = result.first()
+        if row is None:
+            return None
+        return row[0] or _UPLOADED
+
+    async def _write_stage(self, asset_id: str, stage: WorkflowStage) -> bool:
+        """Set an asset's workflow stage in a single UPDATE and commit.
+
+        Returns:
+            False if the asset doesn't exist
+        """
+        result = await self.db.execute(
+            update(Asset)
+            .where(Asset.id == asset_id)
+            .values(workflow_stage=stage)
+            .returning(Asset.workflow_stage)
+        )
+        if result.first() is None:
+            return False
+        await self.db.commit()
+        return True
 
     async def get_workflow_status(self, asset_id: str) -> dict:
         """Get the current workflow status for an asset."""
@@ -64,7 +133,7 @@ class WorkflowService:
 
         return {
             "asset_id": asset_id,
-            "workflow_stage": asset.workflow_stage or WorkflowStage.UPLOADED.value,
+            "workflow_stage": (asset.workflow_stage or _UPLOADED).value,
             "has_mesh": bool(asset.file_path or asset.mesh_path),
             "has_texture": asset.has_texture,
             "is_rigged": asset.is_rigged,
@@ -75,62 +144,39 @@ class WorkflowService:
 
     async def advance_stage(self, asset_id: str, to_stage: str) -> dict:
         """Advance an asset to a specific workflow stage."""
-        asset = await self.get_asset(asset_id)
-        if not asset:
-            return {"success": False, "error": f"Asset {asset_id} not found"}
-
         try:
             target_stage = WorkflowStage(to_stage)
         except ValueError:
             return {"success": False, "error": f"Invalid stage: {to_stage}"}
 
         # Update the workflow stage
-        asset.workflow_stage = target_stage.value
-        await self.db.commit()
+        if not await self._write_stage(asset_id, target_stage):
+            return {"success": False, "error": f"Asset {asset_id} not found"}
 
-        # Broadcast update via WebSocket
-        from src.core.websocket_manager import get_websocket_manager
-        ws = get_websocket_manager()
-        await ws.send_workflow_update(
+        # Broadcast update via WebSocket; the response doesn't wait on delivery
+        send_in_background(get_websocket_manager().send_workflow_update(
             asset_id=asset_id,
             stage=target_stage.value,
             status="advanced",
-            message_text=f"Advanced to {target_stage.value}",
-        )
+            message_text=_ADVANCED_MESSAGES[target_stage],
+        ))
 
         logger.info(f"Asset {asset_id} advanced to stage {target_stage.value}")
 
         return {
             "success": True,
-            "message": f"Advanced to {target_stage.value}",
+            "message": _ADVANCED_MESSAGES[target_stage],
             "asset_id": asset_id,
             "new_stage": target_stage.value,
         }
 
     async def approve_stage(self, asset_id: str) -> dict:
         """Approve the current stage and advance to next."""
-        asset = await self.get_asset(asset_id)
-        if not asset:
+        current_stage = await self._get_stage(asset_id)
+        if current_stage is None:
             return {"success": False, "error": f"Asset {asset_id} not found"}
 
-        current_stage = WorkflowStage(asset.workflow_stage or WorkflowStage.UPLOADED.value)
-
-        # Determine next stage based on current
-        next_stage = None
-        if current_stage == WorkflowStage.UPLOADED:
-            # After upload, should have generated mesh
-            next_stage = WorkflowStage.MESH_GENERATED
-        elif current_stage == WorkflowStage.MESH_GENERATED:
-            next_stage = WorkflowStage.MESH_APPROVED
-        elif current_stage == WorkflowStage.MESH_APPROVED:
-            next_stage = WorkflowStage.TEXTURED
-        elif current_stage == WorkflowStage.TEXTURED:
-            next_stage = WorkflowStage.TEXTURE_APPROVED
-        elif current_stage == WorkflowStage.TEXTURE_APPROVED:
-            next_stage = WorkflowStage.RIGGED
-        elif current_stage == WorkflowStage.RIGGED:
-            next_stage = WorkflowStage.EXPORTED
-        elif current_stage == WorkflowStage.EXPORTED:
+        if current_stage is _EXPORTED:
             # Already at final stage
             return {
                 "success": True,
@@ -140,77 +186,123 @@ class WorkflowService:
                 "next_stage": None,
             }
 
-        if next_stage:
-            asset.workflow_stage = next_stage.value
-            await self.db.commit()
+        next_stage = NEXT_STAGE[current_stage]
+        if not await self._write_stage(asset_id, next_stage):
+            return {"success": False, "error": f"Asset {asset_id} not found"}
 
-            # Broadcast update
-            from src.core.websocket_manager import get_websocket_manager
-            ws = get_websocket_manager()
-            await ws.send_workflow_update(
-                asset_id=asset_id,
-                stage=next_stage.value,
-                status="approved",
-                message_text=f"Stage {current_stage.value} approved, now at {next_stage.value}",
-            )
+        # Broadcast update
+        send_in_background(get_websocket_manager().send_workflow_update(
+            asset_id=asset_id,
+            stage=next_stage.value,
+            status="approved",
+            message_text=_APPROVED_UPDATE_MESSAGES[current_stage],
+        ))
 
-            logger.info(f"Asset {asset_id} stage {current_stage.value} approved, now at {next_stage.value}")
+        logger.info(f"Asset {asset_id} stage {current_stage.value} approved, now at {next_stage.value}")
 
         return {
             "success": True,
-            "message": f"Stage {current_stage.value} approved",
+            "message": _APPROVED_MESSAGES[current_stage],
             "asset_id": asset_id,
             "approved_stage": current_stage.value,
-            "next_stage": next_stage.value if next_stage else None,
+            "next_stage": next_stage.value,
         }
 
     async def skip_to_export(self, asset_id: str) -> dict:
         """Skip remaining stages and go directly to export."""
-        asset = await self.get_asset(asset_id)
-        if not asset:
+        current_stage = await self._get_stage(asset_id)
+        if current_stage is None:
             return {"success": False, "error": f"Asset {asset_id} not found"}
 
-        current_stage = WorkflowStage(asset.workflow_stage or WorkflowStage.UPLOADED.value)
-        current_idx = STAGE_ORDER.index(current_stage)
-        export_idx = STAGE_ORDER.index(WorkflowStage.EXPORTED)
-
-        # Collect skipped stages
-        skipped = []
-        for i in range(current_idx + 1, export_idx):
-            skipped.append(STAGE_ORDER[i].value)
+        skipped = SKIPPED_TO_EXPORT[current_stage]
 
         # Jump to exported
-        asset.workflow_stage = WorkflowStage.EXPORTED.value
-        await self.db.commit()
+        if not await self._write_stage(asset_id, _EXPORTED):
+            return {"success": False, "error": f"Asset {asset_id} not found"}
 
         # Broadcast update
-        from src.core.websocket_manager import get_websocket_manager
-        ws = get_websocket_manager()
-        await ws.send_workflow_update(
+        send_in_background(get_websocket_manager().send_workflow_update(
             asset_id=asset_id,
-            stage=WorkflowStage.EXPORTED.value,
+            stage=_EXPORTED.value,
             status="skipped_to_export",
-            message_text=f"Skipped stages: {', '.join(skipped)}",
-        )
+            message_text=_SKIPPED_MESSAGES[current_stage],
+        ))
 
-        logger.info(f"Asset {asset_id} skipped to export, skipped stages: {skipped}")
+        logger.info(f"Asset {asset_id} skipped to export, skipped stages: {list(skipped)}")
 
         return {
             "success": True,
             "message": "Skipped to export stage",
             "asset_id": asset_id,
-            "skipped_stages": skipped,
+            "skipped_stages": list(skipped),
         }
 
+    async def advance_many(self, asset_ids: list[str]) -> dict:
+        """Approve the current stage of many assets at once.
+
+        Reads every asset's stage in one SELECT and writes all changes in
+        one bulk UPDATE, instead of a round-trip pair per asset. Assets
+        already at the final stage are left unchanged.
+
+        For internal batch jobs; there is no HTTP route for it. Broadcasts
+        the same "advanced" workflow updates as ``advance_stage``.
+
+        Args:
+            asset_ids: Asset IDs to advance
+
+        Returns:
+            Dict with ``advanced`` (asset ID -> new stage), ``unchanged``
+            (already exported) and ``missing`` (unknown IDs)
+        """
+        if not asset_ids:
+            return {"success": True, "advanced": {}, "unchanged": [], "missing": []}
+
+        result = await self.db.execute(
+            select(Asset.id, Asset.workflow_stage).where(Asset.id.in_(asset_ids))
+        )
+        found = []
+        changes = {}
+        for asset_id, stage in result:
+            found.append(asset_id)
+            next_stage = NEXT_STAGE.get(stage or _UPLOADED)
+            if next_stage is not None:
+                changes[asset_id] = next_stage
+
+        if changes:
+            # ORM bulk UPDATE by primary key also updates loaded instances,
+            # so assets held in self._assets see the new stage
+            await self.db.execute(
+                update(Asset),
+                [{"id": asset_id, "workflow_stage": stage} for asset_id, stage in changes.items()],
+            )
+            await self.db.commit()
+
+            send_in_background(self._broadcast_advanced(changes))
+            logger.info(f"Advanced {len(changes)} assets to their next workflow stage")
+
+        found_set = set(found)
+        return {
+            "success": True,
+            "advanced": {asset_id: stage.value for asset_id, stage in changes.items()},
+            "unchanged": [asset_id for asset_id in found if asset_id not in changes],
+            "missing": [asset_id for asset_id in asset_ids if asset_id not in found_set],
+        }
+
+    @staticmethod
+    async def _broadcast_advanced(changes: dict[str, WorkflowStage]) -> None:
+        """Send one workflow update per asset advanced by advance_many."""
+        ws = get_websocket_manager()
+        for asset_id, stage in changes.items():
+            await ws.send_workflow_update(
+                asset_id=asset_id,
+                stage=stage.value,
+                status="advanced",
+                message_text=_ADVANCED_MESSAGES[stage],
+            )
+
     async def set_stage(self, asset_id: str, stage: WorkflowStage) -> bool:
         """Set an asset's workflow stage directly."""
-        asset = await self.get_asset(asset_id)
-        if not asset:
-            return False
-
-        asset.workflow_stage = stage.value
-        await self.db.commit()
-        return True
+        return await self._write_stage(asset_id, stage)
 
 
 # Dependency injection helper
@@ -0,0 +1,31 @@
+"""Shared test fixtures."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.database import Base
+from src.generation import models  # noqa: F401
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    """Session factory for a fresh file-backed SQLite database.
+
+    NullPool opens a connection per session, so sessions work from both
+    ``asyncio.run`` and a TestClient's event loop.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        poolclass=NullPool,
+    )
+
+    async def _create_tables() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(_create_tables())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
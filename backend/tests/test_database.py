@@ -0,0 +1,22 @@
+"""Tests for database setup."""
+
+from sqlalchemy import create_engine, inspect, text
+
+from src.database import Base, _add_missing_columns
+from src.generation import models  # noqa: F401
+
+
+def test_add_missing_columns_upgrades_existing_table():
+    """Nullable columns added to a model reach databases created before them."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE assets DROP COLUMN rigging_blob"))
+        assert "rigging_blob" not in {c["name"] for c in inspect(conn).get_columns("assets")}
+
+        _add_missing_columns(conn)
+
+        assert "rigging_blob" in {c["name"] for c in inspect(conn).get_columns("assets")}
+        # Running again is a no-op
+        _add_missing_columns(conn)
@@ -0,0 +1,135 @@
+"""Tests for skeleton forward kinematics."""
+
+import numpy as np
+import pytest
+
+from src.rigging.skeleton import (
+    HUMANOID_ARRAYS,
+    HUMANOID_BONE_GROUP_INDICES,
+    QUADRUPED_ARRAYS,
+    create_humanoid_skeleton,
+    create_quadruped_skeleton,
+)
+from src.rigging.skeleton.fk import (
+    apply_group_transforms,
+    build_local_matrices,
+    compute_world_matrices,
+)
+from src.rigging.skeleton.humanoid import HUMANOID_GROUP_INDICES, HUMANOID_GROUP_OFFSETS
+from src.rigging.skeleton.quadruped import QUADRUPED_GROUP_INDICES, QUADRUPED_GROUP_OFFSETS
+from src.rigging.skeleton.types import build_group_csr
+
+
+def _random_quats(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    quats = rng.normal(size=(count, 4)).astype(np.float32)
+    return quats / np.linalg.norm(quats, axis=1, keepdims=True)
+
+
+@pytest.fixture(params=["humanoid", "quadruped"])
+def limb_chains(request):
+    """(template arrays, CSR offsets, CSR indices) for each template."""
+    if request.param == "humanoid":
+        return HUMANOID_ARRAYS, HUMANOID_GROUP_OFFSETS, HUMANOID_GROUP_INDICES
+    return QUADRUPED_ARRAYS, QUADRUPED_GROUP_OFFSETS, QUADRUPED_GROUP_INDICES
+
+
+def _check_group_pass(arrays, offsets, indices, apply) -> None:
+    """Posing the chains over a stale buffer reproduces a full FK pass."""
+    parent_idx = arrays.parent_idx
+    local_tr = build_local_matrices(arrays.heads, _random_quats(len(parent_idx)), parent_idx)
+    expected = compute_world_matrices(parent_idx, local_tr, np.empty_like(local_tr))
+
+    world = expected.copy()
+    world[indices] = np.nan
+    apply(offsets, indices, np.ascontiguousarray(parent_idx, dtype=np.int32), local_tr, world)
+
+    np.testing.assert_allclose(world, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_group_transforms_match_full_pass(limb_chains):
+    _check_group_pass(*limb_chains, apply_group_transforms)
+
+
+def test_group_transforms_match_full_pass_compiled(limb_chains):
+    pytest.importorskip("numba")
+    from src.rigging.skeleton import _kernels
+
+    assert _kernels.HAVE_NUMBA
+    _check_group_pass(*limb_chains, _kernels._apply_groups_parallel)
+    _check_group_pass(*limb_chains, _kernels._apply_groups_serial)
+
+
+def test_build_group_csr_rejects_dependent_chains():
+    """A hand chain needs its arm in the same chain, parents first."""
+    with pytest.raises(ValueError, match="not independent"):
+        build_group_csr(
+            (("left_hand",), ("left_arm",)),
+            HUMANOID_BONE_GROUP_INDICES,
+            HUMANOID_ARRAYS.parent_idx,
+        )
+
+    with pytest.raises(ValueError, match="not independent"):
+        build_group_csr(
+            (("left_hand", "left_arm"),),
+            HUMANOID_BONE_GROUP_INDICES,
+            HUMANOID_ARRAYS.parent_idx,
+        )
+
+
+def _reference_pose(skeleton) -> np.ndarray:
+    """World matrices by walking each bone's parent chain in plain Python."""
+    bones = list(skeleton.bones.values())
+
+    def rotation_matrix(quat) -> np.ndarray:
+        x, y, z, w = (float(v) for v in quat)
+        norm = (x * x + y * y + z * z + w * w) ** 0.5
+        x, y, z, w = x / norm, y / norm, z / norm, w / norm
+        return np.array([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ])
+
+    def local(bone) -> np.ndarray:
+        matrix = np.eye(4)
+        matrix[:3, :3] = rotation_matrix(bone.rotation)
+        offset = np.asarray(bone.head, dtype=np.float64)
+        if bone.parent is not None:
+            offset = offset - np.asarray(bone.parent.head, dtype=np.float64)
+        matrix[:3, 3] = offset
+        return matrix
+
+    world = np.empty((len(bones), 4, 4))
+    for i, bone in enumerate(bones):
+        matrix = local(bone)
+        ancestor = bone.parent
+        while ancestor is not None:
+            matrix = local(ancestor) @ matrix
+            ancestor = ancestor.parent
+        world[i] = matrix
+    return world
+
+
+@pytest.mark.parametrize("create", [create_humanoid_skeleton, create_quadruped_skeleton])
+def test_compute_pose_matches_reference(create):
+    skeleton = create()
+
+    world = skeleton.compute_pose()
+
+    np.testing.assert_allclose(world, _reference_pose(skeleton), atol=1e-5)
+    first = next(iter(skeleton.bones.values()))
+    np.testing.assert_array_equal(first.world_matrix, world[0])
+
+
+@pytest.mark.parametrize("create", [create_humanoid_skeleton, create_quadruped_skeleton])
+def test_compute_pose_with_rotations_matches_reference(create):
+    skeleton = create()
+    for bone, quat in zip(skeleton.bones.values(), _random_quats(skeleton.bone_count, seed=1)):
+        bone.rotation = quat
+
+    world = skeleton.compute_pose()
+
+    # Rotations must actually move bones off the rest pose
+    assert not np.allclose(world[:, :3, :3], np.eye(3))
+    np.testing.assert_allclose(world, _reference_pose(skeleton), atol=1e-4)
@@ -0,0 +1,73 @@
+"""Tests for the humanoid skeleton template."""
+
+import numpy as np
+
+from src.rigging.skeleton.humanoid import HUMANOID_TEMPLATE
+
+# Right side of the former hand-written template:
+# (name, parent, head, tail, connected)
+EXPECTED_RIGHT_BONES = [
+    ("RightShoulder", "Spine2", (-0.05, 1.48, 0.0), (-0.15, 1.48, 0.0), False),
+    ("RightArm", "RightShoulder", (-0.15, 1.48, 0.0), (-0.4, 1.48, 0.0), True),
+    ("RightForeArm", "RightArm", (-0.4, 1.48, 0.0), (-0.65, 1.48, 0.0), True),
+    ("RightHand", "RightForeArm", (-0.65, 1.48, 0.0), (-0.75, 1.48, 0.0), True),
+    ("RightHandThumb1", "RightHand", (-0.68, 1.48, 0.02), (-0.71, 1.48, 0.04), False),
+    ("RightHandThumb2", "RightHandThumb1", (-0.71, 1.48, 0.04), (-0.74, 1.48, 0.05), True),
+    ("RightHandThumb3", "RightHandThumb2", (-0.74, 1.48, 0.05), (-0.76, 1.48, 0.06), True),
+    ("RightHandIndex1", "RightHand", (-0.75, 1.48, 0.015), (-0.8, 1.48, 0.015), True),
+    ("RightHandIndex2", "RightHandIndex1", (-0.8, 1.48, 0.015), (-0.84, 1.48, 0.015), True),
+    ("RightHandIndex3", "RightHandIndex2", (-0.84, 1.48, 0.015), (-0.87, 1.48, 0.015), True),
+    ("RightHandMiddle1", "RightHand", (-0.75, 1.48, 0.0), (-0.81, 1.48, 0.0), True),
+    ("RightHandMiddle2", "RightHandMiddle1", (-0.81, 1.48, 0.0), (-0.86, 1.48, 0.0), True),
+    ("RightHandMiddle3", "RightHandMiddle2", (-0.86, 1.48, 0.0), (-0.89, 1.48, 0.0), True),
+    ("RightHandRing1", "RightHand", (-0.75, 1.48, -0.015), (-0.8, 1.48, -0.015), True),
+    ("RightHandRing2", "RightHandRing1", (-0.8, 1.48, -0.015), (-0.84, 1.48, -0.015), True),
+    ("RightHandRing3", "RightHandRing2", (-0.84, 1.48, -0.015), (-0.87, 1.48, -0.015), True),
+    ("RightHandPinky1", "RightHand", (-0.75, 1.48, -0.03), (-0.78, 1.48, -0.03), True),
+    ("RightHandPinky2", "RightHandPinky1", (-0.78, 1.48, -0.03), (-0.81, 1.48, -0.03), True),
+    ("RightHandPinky3", "RightHandPinky2", (-0.81, 1.48, -0.03), (-0.83, 1.48, -0.03), True),
+    ("RightUpLeg", "Hips", (-0.1, 1.0, 0.0), (-0.1, 0.55, 0.0), False),
+    ("RightLeg", "RightUpLeg", (-0.1, 0.55, 0.0), (-0.1, 0.1, 0.0), True),
+    ("RightFoot", "RightLeg", (-0.1, 0.1, 0.0), (-0.1, 0.05, 0.1), True),
+    ("RightToeBase", "RightFoot", (-0.1, 0.05, 0.1), (-0.1, 0.02, 0.18), True),
+]
+
+# Bone order of the former hand-written template; each right run follows
+# its left run
+EXPECTED_ORDER = [
+    "Hips", "Spine", "Spine1", "Spine2", "Neck", "Head",
+    "LeftShoulder", "LeftArm", "LeftForeArm", "LeftHand",
+    "LeftHandThumb1", "LeftHandThumb2", "LeftHandThumb3",
+    "LeftHandIndex1", "LeftHandIndex2", "LeftHandIndex3",
+    "LeftHandMiddle1", "LeftHandMiddle2", "LeftHandMiddle3",
+    "LeftHandRing1", "LeftHandRing2", "LeftHandRing3",
+    "LeftHandPinky1", "LeftHandPinky2", "LeftHandPinky3",
+    "RightShoulder", "RightArm", "RightForeArm", "RightHand",
+    "RightHandThumb1", "RightHandThumb2", "RightHandThumb3",
+    "RightHandIndex1", "RightHandIndex2", "RightHandIndex3",
+    "RightHandMiddle1", "RightHandMiddle2", "RightHandMiddle3",
+    "RightHandRing1", "RightHandRing2", "RightHandRing3",
+    "RightHandPinky1", "RightHandPinky2", "RightHandPinky3",
+    "LeftUpLeg", "LeftLeg", "LeftFoot", "LeftToeBase",
+    "RightUpLeg", "RightLeg", "RightFoot", "RightToeBase",
+]
+
+
+def test_mirrored_bone_order():
+    """Mirrored bones are inserted after their left-side runs."""
+    assert [bone["name"] for bone in HUMANOID_TEMPLATE["bones"]] == EXPECTED_ORDER
+
+
+def test_mirrored_right_side_matches_template():
+    """Right bones mirror the left side exactly as previously hand-written."""
+    right_bones = [
+        bone for bone in HUMANOID_TEMPLATE["bones"] if bone["name"].startswith("Right")
+    ]
+    assert len(right_bones) == len(EXPECTED_RIGHT_BONES)
+
+    for bone, (name, parent, head, tail, connected) in zip(right_bones, EXPECTED_RIGHT_BONES):
+        assert bone["name"] == name
+        assert bone["parent"] == parent
+        assert bone.get("connected", False) == connected
+        np.testing.assert_allclose(bone["head"], head, atol=1e-6, err_msg=name)
+        np.testing.assert_allclose(bone["tail"], tail, atol=1e-6, err_msg=name)
@@ -0,0 +1,59 @@
+"""Tests for the in-memory job queue."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.queue import JobQueue
+
+
+def test_get_status_tracks_every_state_change():
+    """Each mutation invalidates the cached status snapshot."""
+    async def scenario():
+        queue = JobQueue()
+        initial = queue.get_status()
+        assert initial["total_jobs"] == 0
+        # Unchanged state reuses the snapshot
+        assert queue.get_status() is initial
+
+        await queue.enqueue("a", "rig_asset", {})
+        await queue.enqueue("b", "rig_asset", {})
+        await queue.enqueue("c", "rig_asset", {})
+        status = queue.get_status()
+        assert status["queue_size"] == 3
+        assert status["pending_count"] == 3
+        assert status["total_jobs"] == 3
+
+        job = await queue.dequeue()
+        status = queue.get_status()
+        assert status["current_job_id"] == job.id
+        assert status["processing_count"] == 1
+        assert status["pending_count"] == 2
+        assert status["queue_size"] == 2
+
+        await queue.complete(job.id, result={})
+        status = queue.get_status()
+        assert status["current_job_id"] is None
+        assert status["processing_count"] == 0
+        assert status["completed_count"] == 1
+
+        assert await queue.cancel("c")
+        status = queue.get_status()
+        assert status["pending_count"] == 1
+
+        # Age the finished jobs past the cutoff
+        for finished in (queue.get_job(job.id), queue.get_job("c")):
+            finished.completed_at = datetime.utcnow() - timedelta(hours=2)
+        assert await queue.clear_completed(max_age_hours=1) == 2
+        status = queue.get_status()
+        assert status["total_jobs"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_get_status_is_read_only():
+    status = JobQueue().get_status()
+
+    with pytest.raises(TypeError):
+        status["queue_size"] = 99
@@ -0,0 +1,152 @@
+"""Tests for the rigging router."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+
+from src.database import Base, get_session
+from src.generation.models import Asset, AssetStatus, GenerationType
+from src.rigging.router import _active_rig_job_query, router
+from src.rigging.skeleton import create_humanoid_skeleton, create_quadruped_skeleton
+
+
+@pytest.fixture
+def client(session_maker):
+    app = FastAPI()
+    app.include_router(router)
+
+    async def _get_session():
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _get_session
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _save_rig(
+    session_maker,
+    asset_id: str,
+    skeleton_data: Optional[dict],
+    skeleton_blob: Optional[bytes] = None,
+) -> None:
+    """Store (or overwrite) an asset's rigging result."""
+    async def _save() -> None:
+        async with session_maker() as db:
+            asset = await db.get(Asset, asset_id)
+            if asset is None:
+                asset = Asset(
+                    id=asset_id,
+                    name=asset_id,
+                    source_type=GenerationType.IMAGE_TO_3D,
+                    status=AssetStatus.COMPLETED,
+                    file_path=f"{asset_id}.glb",
+                )
+                db.add(asset)
+            asset.is_rigged = True
+            asset.rigging_data = skeleton_data
+            asset.rigging_blob = skeleton_blob
+            await db.commit()
+
+    asyncio.run(_save())
+
+
+def test_active_rig_job_query_uses_index():
+    """The active job check is answered from the composite index."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    executed = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    with engine.connect() as conn:
+        # Run the real statement so IN() is expanded to bound parameters
+        # exactly as the router sends it
+        assert conn.scalar(_active_rig_job_query("asset-1")) is False
+        statement, parameters = executed[-1]
+
+        plan = conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_gen_jobs_asset_type_status" in details
+    assert "SCAN generation_jobs" not in details
+
+
+def test_get_skeleton_after_rerig_is_not_stale(client, session_maker):
+    """A re-rig within the same second still serves the new skeleton."""
+    humanoid = create_humanoid_skeleton().to_skeleton_data().model_dump(mode="json")
+    quadruped = create_quadruped_skeleton().to_skeleton_data().model_dump(mode="json")
+
+    _save_rig(session_maker, "asset-1", humanoid)
+    first = client.get("/rigging/skeleton/asset-1")
+    assert first.status_code == 200
+    assert first.json()["skeleton"]["root_bone"] == humanoid["root_bone"]
+    assert len(first.json()["skeleton"]["bones"]) == len(humanoid["bones"])
+
+    # Served from the response cache
+    assert client.get("/rigging/skeleton/asset-1").content == first.content
+
+    _save_rig(session_maker, "asset-1", quadruped)
+    second = client.get("/rigging/skeleton/asset-1")
+    assert second.status_code == 200
+    assert len(second.json()["skeleton"]["bones"]) == len(quadruped["bones"])
+    assert second.json()["skeleton"]["character_type"] == quadruped["character_type"]
+
+
+def test_get_skeleton_missing_asset(client):
+    assert client.get("/rigging/skeleton/unknown").status_code == 404
+
+
+def test_get_skeleton_reads_blob(client, session_maker):
+    """The binary column is decoded when present, even without JSON."""
+    skeleton = create_quadruped_skeleton().to_skeleton_data()
+    _save_rig(session_maker, "asset-2", None, skeleton.to_bytes())
+
+    response = client.get("/rigging/skeleton/asset-2")
+    assert response.status_code == 200
+    assert response.json()["skeleton"] == skeleton.model_dump(mode="json")
+
+
+def test_list_templates_sends_cache_headers(client):
+    response = client.get("/rigging/templates")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
+    assert response.json()["templates"]
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "W/{etag}",
+    '"other", {etag}',
+    '"other",W/{etag}',
+    "*",
+])
+def test_list_templates_not_modified(client, if_none_match):
+    etag = client.get("/rigging/templates").headers["ETag"]
+
+    response = client.get(
+        "/rigging/templates",
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+def test_list_templates_mismatch_sends_body(client):
+    response = client.get("/rigging/templates", headers={"If-None-Match": '"stale", W/"older"'})
+
+    assert response.status_code == 200
+    assert response.json()["templates"]
@@ -0,0 +1,57 @@
+"""Tests for the rigging service."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.database import Base
+from src.generation.models import Asset, GenerationType
+from src.rigging.service import RiggingService, has_rigging_data
+from src.rigging.skeleton import create_humanoid_skeleton
+
+
+@pytest.mark.parametrize("rigging_json", [None, "", "null", "{}", "[]", " {} "])
+def test_has_rigging_data_rejects_empty_values(rigging_json):
+    assert not has_rigging_data(rigging_json)
+
+
+def test_has_rigging_data_accepts_skeleton():
+    assert has_rigging_data('{"bones": []}')
+
+
+async def _get_skeletons(rigging_data_by_id: dict) -> dict:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        for asset_id, rigging_data in rigging_data_by_id.items():
+            db.add(Asset(
+                id=asset_id,
+                name=asset_id,
+                source_type=GenerationType.IMAGE_TO_3D,
+                file_path=f"{asset_id}.glb",
+                is_rigged=True,
+                rigging_data=rigging_data,
+            ))
+        await db.commit()
+
+        skeletons = await RiggingService(db).get_skeletons(list(rigging_data_by_id))
+
+    await engine.dispose()
+    return skeletons
+
+
+def test_get_skeletons_skips_empty_rigging_data():
+    """Empty rigging_data means "not rigged", as it did before the raw JSON path."""
+    skeleton = create_humanoid_skeleton().to_skeleton_data()
+
+    skeletons = asyncio.run(_get_skeletons({
+        "empty": {},
+        "cleared": None,
+        "rigged": skeleton.model_dump(mode="json"),
+    }))
+
+    assert set(skeletons) == {"rigged"}
+    assert skeletons["rigged"].bone_count == skeleton.bone_count
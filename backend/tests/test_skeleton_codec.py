@@ -0,0 +1,55 @@
+"""Tests for the binary skeleton encoding."""
+
+import numpy as np
+import pytest
+
+from src.rigging.schemas import SkeletonData
+from src.rigging.skeleton import (
+    create_humanoid_skeleton,
+    create_quadruped_skeleton,
+    decode_skeleton,
+    encode_skeleton,
+)
+from src.rigging.skeleton.types import SkeletonArrays
+
+
+@pytest.fixture(params=[create_humanoid_skeleton, create_quadruped_skeleton])
+def skeleton_data(request) -> SkeletonData:
+    return request.param().to_skeleton_data()
+
+
+def test_round_trip_is_exact(skeleton_data):
+    assert decode_skeleton(encode_skeleton(skeleton_data)) == skeleton_data
+    assert SkeletonData.from_bytes(skeleton_data.to_bytes()) == skeleton_data
+
+
+def test_arrays_from_bytes_match_arrays(skeleton_data):
+    expected = skeleton_data.to_arrays()
+    arrays = SkeletonArrays.from_bytes(skeleton_data.to_bytes())
+
+    assert arrays.names == expected.names
+    for field in ("head", "tail", "rot", "parent_idx"):
+        np.testing.assert_array_equal(getattr(arrays, field), getattr(expected, field))
+
+
+def test_bad_magic_raises(skeleton_data):
+    blob = bytearray(skeleton_data.to_bytes())
+    blob[:4] = b"NOPE"
+
+    with pytest.raises(ValueError, match="Not an encoded skeleton"):
+        decode_skeleton(bytes(blob))
+
+
+def test_unsupported_version_raises(skeleton_data):
+    blob = bytearray(skeleton_data.to_bytes())
+    blob[4] += 1
+
+    with pytest.raises(ValueError, match="Unsupported skeleton blob version"):
+        decode_skeleton(bytes(blob))
+
+
+def test_bind_pose_cannot_be_encoded(skeleton_data):
+    posed = skeleton_data.model_copy(update={"bind_pose": {"Hips": [1.0] * 16}})
+
+    with pytest.raises(ValueError, match="bind_pose"):
+        encode_skeleton(posed)
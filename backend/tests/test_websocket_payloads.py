@@ -0,0 +1,59 @@
+"""Tests that hand-built WebSocket payloads match their message schemas."""
+
+import orjson
+import pytest
+
+from src.core.websocket_manager import (
+    error_payload,
+    progress_payload,
+    queue_status_payload,
+    workflow_update_payload,
+)
+from src.core.queue import JobQueue
+from src.websocket.schemas import (
+    ErrorMessage,
+    MessageType,
+    ProgressMessage,
+    QueueStatusMessage,
+    WorkflowUpdateMessage,
+)
+
+PAYLOADS = [
+    (
+        ProgressMessage,
+        MessageType.PROGRESS,
+        progress_payload("job-1", 0.5, "Generating mesh", "processing"),
+    ),
+    (
+        QueueStatusMessage,
+        MessageType.QUEUE_STATUS,
+        queue_status_payload(JobQueue().get_status()),
+    ),
+    (
+        ErrorMessage,
+        MessageType.ERROR,
+        error_payload("INVALID_JSON", "Invalid JSON message"),
+    ),
+    (
+        WorkflowUpdateMessage,
+        MessageType.WORKFLOW_UPDATE,
+        workflow_update_payload("asset-1", "mesh_generated", "advanced", 0.0, "Advanced to mesh_generated"),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("model", "message_type", "payload"),
+    PAYLOADS,
+    ids=[model.__name__ for model, _, _ in PAYLOADS],
+)
+def test_payload_matches_schema(model, message_type, payload):
+    # Sent as text frames; the frontend JSON.parse()s event.data
+    assert isinstance(payload, str)
+    data = orjson.loads(payload)
+
+    message = model.model_validate(data)
+
+    assert message.type == message_type.value
+    assert set(data) <= set(model.model_fields), "payload has keys the schema lacks"
+    assert message.timestamp.tzinfo is not None
@@ -0,0 +1,106 @@
+"""Tests for the workflow service."""
+
+import asyncio
+
+from sqlalchemy import event, update
+
+from src.generation.models import Asset, GenerationType, WorkflowStage
+from src.workflow.service import WorkflowService
+
+
+def _asset(asset_id: str, stage: WorkflowStage = WorkflowStage.UPLOADED) -> Asset:
+    return Asset(
+        id=asset_id,
+        name=asset_id,
+        source_type=GenerationType.IMAGE_TO_3D,
+        file_path=f"{asset_id}.glb",
+        workflow_stage=stage,
+    )
+
+
+def _run(session_maker, scenario):
+    """Run ``scenario(db, statements)`` in a session, recording executed SQL."""
+    async def _main():
+        async with session_maker() as db:
+            statements = []
+            engine = db.bind.sync_engine
+
+            def record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", record)
+            try:
+                return await scenario(db, statements)
+            finally:
+                event.remove(engine, "before_cursor_execute", record)
+
+    return asyncio.run(_main())
+
+
+def test_advance_many_splits_results(session_maker):
+    async def scenario(db, statements):
+        db.add_all([
+            _asset("uploaded"),
+            _asset("textured", WorkflowStage.TEXTURED),
+            _asset("exported", WorkflowStage.EXPORTED),
+        ])
+        await db.commit()
+        return await WorkflowService(db).advance_many(
+            ["uploaded", "textured", "exported", "unknown"]
+        )
+
+    result = _run(session_maker, scenario)
+
+    assert result["advanced"] == {
+        "uploaded": WorkflowStage.MESH_GENERATED.value,
+        "textured": WorkflowStage.TEXTURE_APPROVED.value,
+    }
+    assert result["unchanged"] == ["exported"]
+    assert result["missing"] == ["unknown"]
+
+
+def test_advance_many_treats_null_stage_as_uploaded(session_maker):
+    async def scenario(db, statements):
+        db.add(_asset("legacy"))
+        await db.commit()
+        # Rows written before workflow tracking have no stage
+        await db.execute(update(Asset).values(workflow_stage=None))
+        await db.commit()
+
+        result = await WorkflowService(db).advance_many(["legacy"])
+        stage = await db.scalar(
+            Asset.__table__.select().with_only_columns(Asset.workflow_stage)
+        )
+        return result, stage
+
+    result, stage = _run(session_maker, scenario)
+
+    assert result["advanced"] == {"legacy": WorkflowStage.MESH_GENERATED.value}
+    assert stage == WorkflowStage.MESH_GENERATED
+
+
+def test_advance_many_updates_held_assets(session_maker):
+    async def scenario(db, statements):
+        db.add(_asset("held", WorkflowStage.MESH_APPROVED))
+        await db.commit()
+
+        service = WorkflowService(db)
+        asset = await service.get_asset("held")
+        await service.advance_many(["held"])
+        return asset.workflow_stage, await service.get_workflow_status("held")
+
+    stage, status = _run(session_maker, scenario)
+
+    assert stage == WorkflowStage.TEXTURED
+    assert status["workflow_stage"] == WorkflowStage.TEXTURED.value
+
+
+def test_advance_many_with_no_ids_issues_no_update(session_maker):
+    async def scenario(db, statements):
+        result = await WorkflowService(db).advance_many([])
+        return result, statements
+
+    result, statements = _run(session_maker, scenario)
+
+    assert result["advanced"] == {}
+    assert not any(statement.lstrip().upper().startswith("UPDATE") for statement in statements)
@@ -9,11 +9,14 @@ This script:
 4. Opens the browser
 """
 
+import shutil
+import socket
 import subprocess
 import sys
 import os
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Colors for terminal
@@ -41,23 +44,42 @@ def print_banner():
 {Colors.BLUE}  Powered by Hunyuan3D-2.1{Colors.END}
 """)
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return success status."""
+def run_command(cmd, cwd=None, check=True, capture=True):
+    """Run a command and return success status.
+
+    A list runs directly without a shell; a string goes through the shell.
+    With ``capture=False`` output streams straight to the terminal (for
+    long, noisy commands) and the returned stdout/stderr are empty.
+    """
     try:
+        if isinstance(cmd, list):
+            # Resolve the executable so Windows finds npm.cmd without a shell
+            executable = shutil.which(cmd[0])
+            if executable is None:
+                return False, "", f"{cmd[0]} not found"
+            cmd = [executable, *cmd[1:]]
         result = subprocess.run(
             cmd,
             cwd=cwd,
-            shell=True,
-            capture_output=True,
+            shell=isinstance(cmd, str),
+            capture_output=capture,
             text=True
         )
+        if not capture:
+            return result.returncode == 0, "", ""
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
 
-def check_node():
-    """Check if Node.js is installed."""
-    success, stdout, _ = run_command("node --version")
+def probe_node_tools():
+    """Run the node and npm version probes concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        node, npm = pool.map(run_command, [["node", "--version"], ["npm", "--version"]])
+    return node, npm
+
+def check_node(probe):
+    """Report whether Node.js is installed."""
+    success, stdout, _ = probe
     if success:
         version = stdout.strip()
         print(f"  {Colors.GREEN}✓{Colors.END} Node.js {version}")
@@ -66,9 +88,9 @@ def check_node():
     print(f"    Install from: https://nodejs.org/")
     return False
 
-def check_npm():
-    """Check if npm is installed."""
-    success, stdout, _ = run_command("npm --version")
+def check_npm(probe):
+    """Report whether npm is installed."""
+    success, stdout, _ = probe
     if success:
         print(f"  {Colors.GREEN}✓{Colors.END} npm {stdout.strip()}")
         return True
@@ -83,19 +105,17 @@ def setup_frontend(root_dir):
     # Install dependencies if needed
     if not node_modules.exists():
         print(f"\n{Colors.CYAN}Installing frontend dependencies...{Colors.END}")
-        success, _, stderr = run_command("npm install", cwd=frontend_dir)
+        success, _, _ = run_command("npm install", cwd=frontend_dir, capture=False)
         if not success:
             print(f"{Colors.FAIL}Failed to install frontend dependencies{Colors.END}")
-            print(stderr)
             return False
 
     # Build frontend if needed
     if not dist_dir.exists():
         print(f"\n{Colors.CYAN}Building frontend...{Colors.END}")
-        success, _, stderr = run_command("npm run build", cwd=frontend_dir)
+        success, _, _ = run_command("npm run build", cwd=frontend_dir, capture=False)
         if not success:
             print(f"{Colors.FAIL}Failed to build frontend{Colors.END}")
-            print(stderr)
             return False
         print(f"  {Colors.GREEN}✓{Colors.END} Frontend built successfully")
 
@@ -116,9 +136,10 @@ def setup_backend(root_dir):
         return True
     except ImportError:
         print(f"  {Colors.WARNING}Installing backend dependencies...{Colors.END}")
-        success, _, stderr = run_command(
+        success, _, _ = run_command(
             f"{sys.executable} -m pip install -r requirements.txt",
-            cwd=backend_dir
+            cwd=backend_dir,
+            capture=False,
         )
         if not success:
             print(f"{Colors.FAIL}Failed to install backend dependencies{Colors.END}")
@@ -129,8 +150,8 @@ def start_server(root_dir, port=8000, dev_mode=False):
     """Start the Sweedle server."""
     backend_dir = root_dir / "backend"
 
-    # Add backend to path
-    sys.path.insert(0, str(backend_dir))
+    # Settings resolve ./data and ./storage against the working directory;
+    # uvicorn's app_dir (below) handles the import path
     os.chdir(backend_dir)
 
     print(f"\n{Colors.GREEN}{Colors.BOLD}Starting Sweedle...{Colors.END}")
@@ -138,9 +159,15 @@ def start_server(root_dir, port=8000, dev_mode=False):
     print(f"  {Colors.CYAN}→{Colors.END} API docs: http://localhost:{port}/docs")
     print(f"\n  Press {Colors.BOLD}Ctrl+C{Colors.END} to stop\n")
 
-    # Open browser after a delay
+    # Open browser as soon as the server accepts connections
     def open_browser():
-        time.sleep(2)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                    break
+            except OSError:
+                time.sleep(0.05)
         webbrowser.open(f"http://localhost:{port}")
 
     import threading
@@ -154,7 +181,10 @@ def start_server(root_dir, port=8000, dev_mode=False):
         host="127.0.0.1",
         port=port,
         reload=dev_mode,
-        log_level="info"
+        app_dir=str(backend_dir),
+        # Watch only backend sources, not the whole tree
+        reload_dirs=[str(backend_dir / "src")] if dev_mode else None,
+        log_level="info",
     )
 
 def main():
@@ -171,17 +201,25 @@ def main():
         sys.exit(1)
     print(f"  {Colors.GREEN}✓{Colors.END} Python {py_version.major}.{py_version.minor}.{py_version.micro}")
 
-    # Check Node.js (for frontend build)
-    if not check_node():
-        print(f"\n{Colors.WARNING}Node.js is required for first-time setup.{Colors.END}")
-        print("Install from: https://nodejs.org/")
-        sys.exit(1)
-
-    check_npm()
-
-    # Setup frontend
-    if not setup_frontend(root_dir):
-        sys.exit(1)
+    # Node.js is only needed until the frontend is installed and built
+    frontend_dir = root_dir / "frontend"
+    needs_node = not (frontend_dir / "node_modules").exists() or not (frontend_dir / "dist").exists()
+
+    if needs_node:
+        # Check Node.js (for frontend build)
+        node_probe, npm_probe = probe_node_tools()
+        if not check_node(node_probe):
+            print(f"\n{Colors.WARNING}Node.js is required for first-time setup.{Colors.END}")
+            print("Install from: https://nodejs.org/")
+            sys.exit(1)
+
+        check_npm(npm_probe)
+
+        # Setup frontend
+        if not setup_frontend(root_dir):
+            sys.exit(1)
+    else:
+        print(f"  {Colors.GREEN}✓{Colors.END} Frontend already built")
 
     # Setup backend
     if not setup_backend(root_dir):